@@ -1,197 +1,78 @@
 import os
-import json
 import logging
 import asyncio
-from typing import Dict, Any, List
-from google import genai
+import hashlib
+import re
+import time
+import random
+import weakref
+import httpx
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from ai_engines.gemini_client import get_gemini_client
 from models.brand_strategy import BusinessInput, BrandStrategy
-
-class AdvancedBrandStrategyEngine:
-    """Phase 2: Advanced Multi-Layer AI Strategy Engine using Gemini AI with sophisticated strategic reasoning"""
-    
-    def __init__(self):
-        self.client = genai.Client(api_key=os.environ.get('GEMINI_API_KEY'))
-        self.gemini_model = "gemini-2.5-flash"
-        self.analysis_layers = 5
-        
-    async def analyze_business_concept(self, business_input: BusinessInput) -> Dict[str, Any]:
-        """Revolutionary 5-Layer Strategic Analysis System"""
-        
-        # Layer 1: Market Analysis & Industry Intelligence
-        market_analysis = await self.analyze_market_position(business_input)
-        
-        # Layer 2: Competitive Landscape & Differentiation
-        competitive_analysis = await self.analyze_competitive_landscape(business_input, market_analysis)
-        
-        # Layer 3: Brand Personality & Archetype Development
-        personality_analysis = await self.develop_brand_personality(
-            business_input, market_analysis, competitive_analysis
-        )
-        
-        # Layer 4: Visual Direction & Creative Brief
-        visual_brief = await self.create_visual_brief(
-            personality_analysis, market_analysis, business_input
-        )
-        
-        # Layer 5: Strategic Synthesis & Recommendations
-        strategic_synthesis = await self.synthesize_strategy(
-            market_analysis, competitive_analysis, personality_analysis, visual_brief, business_input
-        )
-        
-        return {
-            "market_intelligence": market_analysis,
-            "competitive_positioning": competitive_analysis,
-            "brand_personality": personality_analysis,
-            "visual_direction": visual_brief,
-            "strategic_recommendations": strategic_synthesis,
-            "confidence_scores": self.calculate_analysis_confidence(
-                market_analysis, competitive_analysis, personality_analysis, visual_brief, strategic_synthesis
-            )
-        }
-        
-
-    
-    async def generate_comprehensive_strategy(self, business_input: BusinessInput) -> BrandStrategy:
-        """Generate comprehensive brand strategy using Phase 2 advanced multi-layer analysis"""
-        
-        # Get revolutionary 5-layer analysis
-        analysis = await self.analyze_business_concept(business_input)
-        
-        # Build final strategy from all analysis layers
-        strategy_prompt = self._build_phase2_strategy_prompt(business_input, analysis)
-        
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=strategy_prompt
-                )
-            )
-            
-            # Extract and parse JSON response
-            strategy_text = response.text.strip()
-            if strategy_text.startswith('```json'):
-                strategy_text = strategy_text.replace('```json', '').replace('```', '').strip()
-            
-            strategy_data = json.loads(strategy_text)
-            
-            # Create BrandStrategy object with Phase 2 enhanced data
-            brand_strategy = BrandStrategy(
-                business_name=business_input.business_name,
-                brand_personality=strategy_data["brand_personality"],
-                visual_direction=strategy_data["visual_direction"],
-                color_palette=strategy_data["color_palette"],
-                messaging_framework=strategy_data["messaging_framework"],
-                consistency_rules=strategy_data["consistency_rules"],
-                advanced_analysis=analysis  # Include all Phase 2 analysis data
-            )
-            
-            return brand_strategy
-            
-        except Exception as e:
-            logging.error(f"Error generating Phase 2 comprehensive brand strategy: {str(e)}")
-            # Enhanced fallback with Phase 2 capabilities
-            return await self._generate_phase2_fallback_strategy(business_input)
-
-    def _build_phase2_strategy_prompt(self, business_input: BusinessInput, analysis: Dict[str, Any]) -> str:
-        """Build Phase 2 advanced strategy generation prompt with multi-layer analysis"""
-        
-        return f"""
-You are an expert brand strategist with 20+ years of experience creating world-class brand strategies.
-You have access to comprehensive 5-layer strategic analysis. Create the most sophisticated brand strategy possible.
-
-BUSINESS INFORMATION:
-- Name: {business_input.business_name}
-- Description: {business_input.business_description}
-- Industry: {business_input.industry}
-- Target Audience: {business_input.target_audience}
-- Values: {', '.join(business_input.business_values)}
-- Style Preference: {business_input.preferred_style}
-- Color Preference: {business_input.preferred_colors}
-
-ADVANCED STRATEGIC ANALYSIS (5 LAYERS):
-
-LAYER 1 - MARKET INTELLIGENCE:
-Market Position: {analysis.get('market_intelligence', {}).get('positioning_recommendations', {}).get('optimal_position', 'Standard')}
-Growth Opportunities: {analysis.get('market_intelligence', {}).get('market_opportunities', {}).get('emerging_trends', [])}
-
-LAYER 2 - COMPETITIVE POSITIONING:
-Differentiation Strategy: {analysis.get('competitive_positioning', {}).get('differentiation_strategy', {}).get('positioning_against_competition', 'Standard')}
-Unique Value Props: {analysis.get('competitive_positioning', {}).get('differentiation_strategy', {}).get('unique_value_propositions', [])}
-
-LAYER 3 - BRAND PERSONALITY:
-Primary Archetype: {analysis.get('brand_personality', {}).get('brand_archetype', {}).get('primary_archetype', 'Innovator')}
-Core Traits: {[trait.get('trait', '') for trait in analysis.get('brand_personality', {}).get('personality_traits', {}).get('core_traits', [])]}
-
-LAYER 4 - VISUAL DIRECTION:
-Visual Philosophy: {analysis.get('visual_direction', {}).get('visual_strategy', {}).get('visual_philosophy', 'Modern approach')}
-Color Strategy: {analysis.get('visual_direction', {}).get('color_strategy', {}).get('color_psychology_rationale', 'Strategic colors')}
-
-LAYER 5 - STRATEGIC SYNTHESIS:
-Key Insights: {analysis.get('strategic_recommendations', {}).get('strategic_insights', {}).get('key_insights', [])}
-Brand Promise: {analysis.get('strategic_recommendations', {}).get('brand_strategy_framework', {}).get('brand_promise', 'Excellence')}
-
-Generate the most advanced brand strategy with this exact JSON structure:
-{{
-    "brand_personality": {{
-        "primary_traits": ["trait1", "trait2", "trait3", "trait4", "trait5"],
-        "brand_archetype": "archetype_name_from_analysis",
-        "tone_of_voice": "sophisticated_tone_description_based_on_analysis",
-        "brand_essence": "powerful_one_sentence_brand_essence",
-        "emotional_drivers": ["driver1", "driver2", "driver3"],
-        "personality_expression": "how_personality_shows_up_across_touchpoints"
-    }},
-    "visual_direction": {{
-        "design_style": "advanced_style_description_from_visual_brief",
-        "visual_mood": "sophisticated_mood_from_analysis",
-        "typography_strategy": "strategic_typography_recommendations",
-        "imagery_style": "advanced_imagery_direction",
-        "logo_direction": "detailed_logo_design_guidance_from_brief",
-        "layout_principles": "advanced_layout_composition_guidelines",
-        "visual_consistency_framework": "comprehensive_visual_consistency_approach"
-    }},
-    "color_palette": ["#strategic_primary", "#strategic_secondary", "#strategic_accent1", "#strategic_accent2", "#strategic_neutral"],
-    "messaging_framework": {{
-        "tagline": "compelling_memorable_tagline_from_synthesis",
-        "key_messages": ["strategic_message1", "strategic_message2", "strategic_message3"],
-        "brand_promise": "clear_brand_promise_from_analysis",
-        "unique_value_proposition": "distinctive_uvp_from_competitive_analysis",
-        "brand_story": "compelling_brand_narrative_from_all_layers",
-        "messaging_hierarchy": "how_messages_prioritize_and_connect"
-    }},
-    "consistency_rules": {{
-        "logo_usage": "detailed_logo_usage_guidelines_from_visual_brief",
-        "color_usage": "strategic_color_application_rules",
-        "typography_rules": "comprehensive_typography_hierarchy",
-        "visual_consistency": "advanced_visual_consistency_requirements",
-        "brand_voice_consistency": "sophisticated_voice_tone_consistency_rules",
-        "touchpoint_consistency": "how_brand_stays_consistent_across_all_touchpoints"
-    }},
-    "strategic_insights": {{
-        "market_opportunity": "key_market_opportunity_from_analysis",
-        "competitive_advantage": "primary_competitive_advantage",
-        "brand_positioning": "precise_brand_positioning_statement",
-        "success_factors": ["factor1", "factor2", "factor3"]
-    }}
-}}
-
-Make the strategy revolutionary, sophisticated, and perfectly aligned with all 5 layers of strategic analysis.
-This should be the most advanced brand strategy possible using AI-powered multi-layer intelligence.
-        """
-    
-    async def analyze_market_position(self, business_input: BusinessInput) -> Dict[str, Any]:
-        """Layer 1: Advanced Market Analysis & Industry Intelligence"""
-        
-        market_analysis_prompt = f"""
-You are a senior market research analyst with 15+ years experience. Analyze this business:
-
-BUSINESS: {business_input.business_description}
-INDUSTRY: {business_input.industry}
-TARGET AUDIENCE: {business_input.target_audience}
-BUSINESS VALUES: {', '.join(business_input.business_values)}
-
-Provide comprehensive market analysis:
-
+from models.strategy_analysis import (
+    MarketAnalysis, CompetitiveAnalysis, PersonalityAnalysis, VisualBrief, StrategicSynthesis, StrategyDraft
+)
+
+# Retry policy for transient Gemini failures (delays in seconds)
+GEMINI_MAX_ATTEMPTS = 5
+GEMINI_RETRY_BASE_DELAY = 1.0
+GEMINI_RETRY_MAX_DELAY = 30.0
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Consecutive transient failures that open the circuit, and how long it stays open
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 10
+CIRCUIT_BREAKER_RESET_SECONDS = 60
+
+# Gemini calls allowed in flight at once across all engine instances, sized to
+# the account's rate limit so request bursts queue instead of triggering 429s
+GEMINI_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "20"))
+
+# Deadline (seconds) for a single Gemini attempt, so a stalled stream is retried
+# or falls back instead of holding a concurrency slot indefinitely. Sized for the
+# largest (single-shot) reply.
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_S", "60"))
+
+# Generation limits for structured JSON replies. A low temperature keeps replies
+# stable (and cacheable); answer caps are sized to each schema with headroom, and
+# Gemini 2.5 counts thinking tokens against max_output_tokens, so a fixed thinking
+# budget is added on top.
+STRUCTURED_TEMPERATURE = 0.2
+THINKING_BUDGET_TOKENS = 1024
+MARKET_ANALYSIS_OUTPUT_TOKENS = 1500
+COMPETITIVE_ANALYSIS_OUTPUT_TOKENS = 1500
+PERSONALITY_ANALYSIS_OUTPUT_TOKENS = 2000
+VISUAL_BRIEF_OUTPUT_TOKENS = 2500
+STRATEGIC_SYNTHESIS_OUTPUT_TOKENS = 2000
+SINGLE_SHOT_ANALYSIS_OUTPUT_TOKENS = 10000
+PHASE2_STRATEGY_OUTPUT_TOKENS = 2500
+
+# Complete analyses kept per business input; bump the version whenever the
+# analysis prompts or schemas change so stale analyses are not served
+ANALYSIS_CACHE_SIZE = 128
+ANALYSIS_SCHEMA_VERSION = "1"
+
+# Runs of whitespace collapsed when normalizing prompts into cache keys
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Number of parsed Gemini replies kept for reuse by identical prompts
+RESPONSE_CACHE_SIZE = 256
+
+# Keys of the five analysis layers, in pipeline order
+ANALYSIS_LAYER_KEYS = (
+    "market_intelligence",
+    "competitive_positioning",
+    "brand_personality",
+    "visual_direction",
+    "strategic_recommendations"
+)
+
+# Per-layer analysis rubrics and JSON response schemas, shared by the layered
+# and single-shot analysis prompts
+MARKET_ANALYSIS_RUBRIC = """
 1. MARKET SIZE & GROWTH POTENTIAL
    - Total Addressable Market (TAM)
    - Market growth trends and drivers
@@ -216,76 +97,45 @@ Provide comprehensive market analysis:
    - Optimal market position
    - Value proposition positioning
    - Differentiation strategies
+""".strip()
 
-Respond in this exact JSON format:
-{{
-    "market_size_analysis": {{
+MARKET_ANALYSIS_SCHEMA = """
+{
+    "market_size_analysis": {
         "total_addressable_market": "TAM description and size estimation",
         "growth_trends": ["trend1", "trend2", "trend3"],
         "market_drivers": ["driver1", "driver2", "driver3"]
-    }},
-    "industry_dynamics": {{
+    },
+    "industry_dynamics": {
         "major_trends": ["trend1", "trend2", "trend3"],
         "regulatory_environment": "regulatory landscape description",
         "technology_disruptions": ["disruption1", "disruption2"],
         "industry_challenges": ["challenge1", "challenge2"]
-    }},
-    "target_audience_insights": {{
+    },
+    "target_audience_insights": {
         "demographics": "demographic profile",
         "psychographics": "psychological and behavioral traits",
         "pain_points": ["pain1", "pain2", "pain3"],
         "buying_behavior": "buying patterns and decision making process",
         "unmet_needs": ["need1", "need2", "need3"]
-    }},
-    "market_opportunities": {{
+    },
+    "market_opportunities": {
         "underserved_segments": ["segment1", "segment2"],
         "emerging_trends": ["trend1", "trend2", "trend3"],
         "partnership_opportunities": ["opportunity1", "opportunity2"],
         "market_gaps": ["gap1", "gap2"]
-    }},
-    "positioning_recommendations": {{
+    },
+    "positioning_recommendations": {
         "optimal_position": "recommended market position",
         "value_proposition_focus": "key value proposition elements",
         "differentiation_strategy": "how to differentiate from competition",
         "positioning_statement": "concise positioning statement"
-    }},
+    },
     "confidence_score": 0.95
-}}
-
-Be specific, data-driven, and actionable. Focus on insights that inform brand strategy.
-        """
-        
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=market_analysis_prompt
-                )
-            )
-            
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
-            return json.loads(response_text)
-            
-        except Exception as e:
-            logging.error(f"Error in market analysis: {str(e)}")
-            return self._get_fallback_market_analysis()
-    
-    async def analyze_competitive_landscape(self, business_input: BusinessInput, market_analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Layer 2: Advanced Competitive Landscape & Differentiation Analysis"""
-        
-        competitive_analysis_prompt = f"""
-You are a competitive intelligence expert. Analyze the competitive landscape:
-
-BUSINESS CONTEXT: {business_input.business_description}
-INDUSTRY: {business_input.industry}
-TARGET MARKET: {business_input.target_audience}
-MARKET ANALYSIS: {market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning')}
-
-Provide detailed competitive analysis:
+}
+""".strip()
 
+COMPETITIVE_ANALYSIS_RUBRIC = """
 1. COMPETITIVE LANDSCAPE MAPPING
    - Direct competitors (3-5 main players)
    - Indirect competitors and substitutes
@@ -310,83 +160,50 @@ Provide detailed competitive analysis:
    - Competitive response strategies
    - Market entry/expansion tactics
    - Brand positioning vs. competition
+""".strip()
 
-Respond in this exact JSON format:
-{{
-    "competitive_landscape": {{
+COMPETITIVE_ANALYSIS_SCHEMA = """
+{
+    "competitive_landscape": {
         "direct_competitors": [
-            {{"name": "competitor1", "market_share": "percentage", "strengths": ["strength1", "strength2"]}},
-            {{"name": "competitor2", "market_share": "percentage", "strengths": ["strength1", "strength2"]}},
-            {{"name": "competitor3", "market_share": "percentage", "strengths": ["strength1", "strength2"]}}
+            {"name": "competitor1", "market_share": "percentage", "strengths": ["strength1", "strength2"]},
+            {"name": "competitor2", "market_share": "percentage", "strengths": ["strength1", "strength2"]},
+            {"name": "competitor3", "market_share": "percentage", "strengths": ["strength1", "strength2"]}
         ],
         "indirect_competitors": ["substitute1", "substitute2", "substitute3"],
         "competitive_intensity": "high/medium/low with explanation"
-    }},
-    "competitor_analysis": {{
+    },
+    "competitor_analysis": {
         "market_leaders": ["leader1", "leader2"],
         "brand_strength_ranking": ["brand1", "brand2", "brand3"],
-        "competitive_advantages_by_player": {{
+        "competitive_advantages_by_player": {
             "competitor1": ["advantage1", "advantage2"],
             "competitor2": ["advantage1", "advantage2"]
-        }}
-    }},
-    "market_gaps": {{
+        }
+    },
+    "market_gaps": {
         "unmet_customer_needs": ["need1", "need2", "need3"],
         "service_gaps": ["gap1", "gap2"],
         "positioning_white_spaces": ["space1", "space2"],
         "underserved_segments": ["segment1", "segment2"]
-    }},
-    "differentiation_strategy": {{
+    },
+    "differentiation_strategy": {
         "unique_value_propositions": ["uvp1", "uvp2", "uvp3"],
         "competitive_moats": ["moat1", "moat2"],
         "positioning_against_competition": "how to position vs competitors",
         "differentiation_pillars": ["pillar1", "pillar2", "pillar3"]
-    }},
-    "strategic_recommendations": {{
+    },
+    "strategic_recommendations": {
         "competitive_response_strategies": ["strategy1", "strategy2"],
         "market_entry_tactics": ["tactic1", "tactic2"],
         "brand_positioning_strategy": "recommended positioning vs competition",
         "competitive_messaging": "how to message against competition"
-    }},
+    },
     "confidence_score": 0.90
-}}
-
-Focus on actionable insights for brand differentiation and positioning.
-        """
-        
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=competitive_analysis_prompt
-                )
-            )
-            
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
-            return json.loads(response_text)
-            
-        except Exception as e:
-            logging.error(f"Error in competitive analysis: {str(e)}")
-            return self._get_fallback_competitive_analysis()
-    
-    async def develop_brand_personality(self, business_input: BusinessInput, market_analysis: Dict, competitive_analysis: Dict) -> Dict[str, Any]:
-        """Layer 3: Advanced Brand Personality & Archetype Development"""
-        
-        brand_personality_prompt = f"""
-You are a brand psychology expert specializing in brand archetypes and personality development.
-
-BUSINESS CONTEXT: {business_input.business_description}
-MARKET INSIGHTS: {market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning')}
-COMPETITIVE LANDSCAPE: {competitive_analysis.get('differentiation_strategy', {}).get('positioning_against_competition', 'Standard strategy')}
-INDUSTRY: {business_input.industry}
-TARGET AUDIENCE: {business_input.target_audience}
-BUSINESS VALUES: {', '.join(business_input.business_values)}
-
-Develop comprehensive brand personality:
+}
+""".strip()
 
+PERSONALITY_ANALYSIS_RUBRIC = """
 1. BRAND ARCHETYPE SELECTION
    - Primary archetype (Hero, Sage, Innovator, etc.)
    - Secondary archetype influences
@@ -416,98 +233,64 @@ Develop comprehensive brand personality:
    - Primary emotions to evoke
    - Emotional journey mapping
    - Feeling-based differentiation
+""".strip()
 
-Respond in this exact JSON format:
-{{
-    "brand_archetype": {{
+PERSONALITY_ANALYSIS_SCHEMA = """
+{
+    "brand_archetype": {
         "primary_archetype": "archetype name",
         "secondary_influences": ["influence1", "influence2"],
         "archetype_justification": "why this archetype fits the market position and business goals",
         "archetype_characteristics": ["characteristic1", "characteristic2", "characteristic3"]
-    }},
-    "personality_traits": {{
+    },
+    "personality_traits": {
         "core_traits": [
-            {{"trait": "trait1", "description": "detailed explanation", "expression": "how it shows up"}},
-            {{"trait": "trait2", "description": "detailed explanation", "expression": "how it shows up"}},
-            {{"trait": "trait3", "description": "detailed explanation", "expression": "how it shows up"}},
-            {{"trait": "trait4", "description": "detailed explanation", "expression": "how it shows up"}},
-            {{"trait": "trait5", "description": "detailed explanation", "expression": "how it shows up"}}
+            {"trait": "trait1", "description": "detailed explanation", "expression": "how it shows up"},
+            {"trait": "trait2", "description": "detailed explanation", "expression": "how it shows up"},
+            {"trait": "trait3", "description": "detailed explanation", "expression": "how it shows up"},
+            {"trait": "trait4", "description": "detailed explanation", "expression": "how it shows up"},
+            {"trait": "trait5", "description": "detailed explanation", "expression": "how it shows up"}
         ],
         "personality_summary": "cohesive personality description"
-    }},
-    "brand_voice": {{
+    },
+    "brand_voice": {
         "communication_style": "primary communication approach",
-        "tone_variations": {{
+        "tone_variations": {
             "formal_contexts": "tone for formal situations",
             "casual_contexts": "tone for casual interactions",
             "crisis_contexts": "tone during challenges"
-        }},
+        },
         "language_patterns": ["pattern1", "pattern2", "pattern3"],
         "vocabulary_preferences": ["preference1", "preference2"]
-    }},
-    "brand_values_beliefs": {{
+    },
+    "brand_values_beliefs": {
         "core_values": ["value1", "value2", "value3", "value4", "value5"],
         "brand_purpose": "why the brand exists beyond profit",
         "mission_statement": "what the brand aims to achieve",
         "belief_system": ["belief1", "belief2", "belief3"],
         "worldview": "how the brand sees the world"
-    }},
-    "relationship_dynamics": {{
+    },
+    "relationship_dynamics": {
         "customer_relationship_model": "how brand relates to customers",
         "trust_building_approach": "how trust is established",
         "credibility_factors": ["factor1", "factor2", "factor3"],
         "relationship_goals": ["goal1", "goal2"]
-    }},
-    "emotional_positioning": {{
+    },
+    "emotional_positioning": {
         "primary_emotions": ["emotion1", "emotion2", "emotion3"],
-        "emotional_journey": {{
+        "emotional_journey": {
             "awareness": "emotion at first contact",
             "consideration": "emotion during evaluation",
             "purchase": "emotion at decision",
             "loyalty": "emotion as loyal customer"
-        }},
+        },
         "feeling_differentiation": "unique emotional position vs competitors"
-    }},
+    },
     "confidence_score": 0.92
-}}
-
-Ensure personality aligns with market opportunity and competitive positioning.
-        """
-        
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=brand_personality_prompt
-                )
-            )
-            
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
-            return json.loads(response_text)
-            
-        except Exception as e:
-            logging.error(f"Error in brand personality development: {str(e)}")
-            return self._get_fallback_personality_analysis()
-    
-    async def create_visual_brief(self, personality_analysis: Dict, market_analysis: Dict, business_input: BusinessInput) -> Dict[str, Any]:
-        """Layer 4: Advanced Visual Direction & Creative Brief Development"""
-        
-        visual_brief_prompt = f"""
-You are a creative director with expertise in visual brand identity and design strategy.
-
-BRAND PERSONALITY: {personality_analysis.get('brand_archetype', {}).get('primary_archetype', 'Innovator')}
-PERSONALITY TRAITS: {[trait.get('trait', '') for trait in personality_analysis.get('personality_traits', {}).get('core_traits', [])]}
-MARKET POSITION: {market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning')}
-BUSINESS CONTEXT: {business_input.business_description}
-INDUSTRY: {business_input.industry}
-STYLE PREFERENCE: {business_input.preferred_style}
-COLOR PREFERENCE: {business_input.preferred_colors}
-
-Create comprehensive visual direction and creative brief:
+}
+""".strip()
 
+VISUAL_BRIEF_RUBRIC = """
 1. VISUAL STRATEGY FOUNDATION
    - Overall visual approach and philosophy
    - Visual personality expression
@@ -537,97 +320,63 @@ Create comprehensive visual direction and creative brief:
    - Logo design direction and requirements
    - Identity system architecture
    - Application and usage principles
+""".strip()
 
-Respond in this exact JSON format:
-{{
-    "visual_strategy": {{
+VISUAL_BRIEF_SCHEMA = """
+{
+    "visual_strategy": {
         "visual_philosophy": "overarching visual philosophy and approach",
         "visual_personality_expression": "how personality shows up visually",
         "visual_goals": ["goal1", "goal2", "goal3"],
         "brand_visual_positioning": "how visuals position the brand"
-    }},
-    "design_system": {{
+    },
+    "design_system": {
         "primary_design_principles": ["principle1", "principle2", "principle3"],
         "visual_hierarchy": "hierarchy structure and approach",
         "design_components": ["component1", "component2", "component3"],
         "consistency_framework": "how visual consistency is maintained"
-    }},
-    "color_strategy": {{
+    },
+    "color_strategy": {
         "strategic_palette": [
-            {{"color": "#primary", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}},
-            {{"color": "#secondary", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}},
-            {{"color": "#accent1", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}},
-            {{"color": "#accent2", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}},
-            {{"color": "#neutral", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}}
+            {"color": "#primary", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"},
+            {"color": "#secondary", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"},
+            {"color": "#accent1", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"},
+            {"color": "#accent2", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"},
+            {"color": "#neutral", "hex": "#hexcode", "psychology": "emotional impact", "usage": "usage guidelines"}
         ],
         "color_psychology_rationale": "why these colors support the brand strategy",
         "color_combinations": "recommended color pairings and relationships"
-    }},
-    "typography_strategy": {{
+    },
+    "typography_strategy": {
         "typography_personality": "how typography expresses brand personality",
         "font_selection_criteria": "what to look for in fonts",
-        "typographic_hierarchy": {{
+        "typographic_hierarchy": {
             "primary_heading": "font characteristics for main headlines",
             "secondary_heading": "font characteristics for subheadings", 
             "body_text": "font characteristics for body copy",
             "accent_text": "font characteristics for special text"
-        }},
+        },
         "typography_applications": "how typography is used across touchpoints"
-    }},
-    "imagery_direction": {{
+    },
+    "imagery_direction": {
         "photography_style": "photography approach and characteristics",
         "illustration_style": "illustration approach if applicable",
         "visual_content_strategy": "overall approach to visual content",
         "mood_aesthetic": "overall aesthetic and mood direction",
         "visual_storytelling": "how visuals tell the brand story"
-    }},
-    "logo_identity_brief": {{
+    },
+    "logo_identity_brief": {
         "logo_design_direction": "specific logo design requirements and direction",
         "identity_system_requirements": "what the identity system needs to include",
         "logo_personality_expression": "how logo should express brand personality",
         "application_considerations": "key applications and usage scenarios",
         "logo_effectiveness_criteria": "how to measure logo success"
-    }},
+    },
     "confidence_score": 0.94
-}}
-
-Ensure all visual direction aligns with brand personality and market positioning.
-        """
-        
-        try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=visual_brief_prompt
-                )
-            )
-            
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
-            return json.loads(response_text)
-            
-        except Exception as e:
-            logging.error(f"Error in visual brief creation: {str(e)}")
-            return self._get_fallback_visual_brief()
-
-    async def synthesize_strategy(self, market_analysis: Dict, competitive_analysis: Dict, 
-                                personality_analysis: Dict, visual_brief: Dict, business_input: BusinessInput) -> Dict[str, Any]:
-        """Layer 5: Advanced Strategic Synthesis & Comprehensive Recommendations"""
-        
-        synthesis_prompt = f"""
-You are a senior brand strategist synthesizing comprehensive brand strategy analysis.
-
-SYNTHESIS INPUTS:
-MARKET INTELLIGENCE: {market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard')}
-COMPETITIVE POSITIONING: {competitive_analysis.get('differentiation_strategy', {}).get('positioning_against_competition', 'Standard')}  
-BRAND PERSONALITY: {personality_analysis.get('brand_archetype', {}).get('primary_archetype', 'Innovator')}
-VISUAL DIRECTION: {visual_brief.get('visual_strategy', {}).get('visual_philosophy', 'Modern approach')}
-BUSINESS CONTEXT: {business_input.business_description}
-
-Create comprehensive strategic synthesis and recommendations:
+}
+""".strip()
 
+STRATEGIC_SYNTHESIS_RUBRIC = """
 1. STRATEGIC INSIGHTS INTEGRATION
    - Key insights from all analysis layers
    - Strategic themes and patterns
@@ -652,378 +401,1168 @@ Create comprehensive strategic synthesis and recommendations:
    - Immediate action items
    - Long-term strategic initiatives
    - Risk mitigation strategies
+""".strip()
 
-Respond in this exact JSON format:
-{{
-    "strategic_insights": {{
+STRATEGIC_SYNTHESIS_SCHEMA = """
+{
+    "strategic_insights": {
         "key_insights": ["insight1", "insight2", "insight3", "insight4"],
         "strategic_themes": ["theme1", "theme2", "theme3"],
         "critical_success_factors": ["factor1", "factor2", "factor3"],
         "strategic_opportunities": ["opportunity1", "opportunity2"]
-    }},
-    "brand_strategy_framework": {{
+    },
+    "brand_strategy_framework": {
         "unified_strategy": "comprehensive brand strategy statement",
         "positioning_statement": "precise brand positioning",
         "strategy_pillars": ["pillar1", "pillar2", "pillar3", "pillar4"],
         "brand_promise": "clear brand promise to customers",
         "unique_value_proposition": "distinctive value proposition"
-    }},
-    "implementation_roadmap": {{
-        "phase_1_immediate": {{
+    },
+    "implementation_roadmap": {
+        "phase_1_immediate": {
             "timeline": "0-3 months",
             "priorities": ["priority1", "priority2", "priority3"],
             "deliverables": ["deliverable1", "deliverable2"]
-        }},
-        "phase_2_build": {{
+        },
+        "phase_2_build": {
             "timeline": "3-9 months", 
             "priorities": ["priority1", "priority2", "priority3"],
             "deliverables": ["deliverable1", "deliverable2"]
-        }},
-        "phase_3_optimize": {{
+        },
+        "phase_3_optimize": {
             "timeline": "9-18 months",
             "priorities": ["priority1", "priority2"],
             "deliverables": ["deliverable1", "deliverable2"]
-        }}
-    }},
-    "success_measurement": {{
+        }
+    },
+    "success_measurement": {
         "kpis": ["kpi1", "kpi2", "kpi3", "kpi4"],
-        "success_metrics": {{
+        "success_metrics": {
             "brand_awareness": "awareness measurement approach",
             "brand_perception": "perception tracking method",
             "business_impact": "business impact metrics"
-        }},
+        },
         "measurement_frequency": "how often to measure progress"
-    }},
-    "strategic_recommendations": {{
+    },
+    "strategic_recommendations": {
         "immediate_actions": ["action1", "action2", "action3"],
         "long_term_initiatives": ["initiative1", "initiative2"],
         "risk_mitigation": ["risk1_mitigation", "risk2_mitigation"],
         "competitive_response": "how to respond to competitive moves"
-    }},
+    },
     "confidence_score": 0.96
-}}
+}
+""".strip()
+
+# Invariant head of each layer prompt (role, rubric, schema). Business-specific
+# fields are appended after it so every call shares a byte-identical prefix
+# that Gemini's prompt caching can reuse. Prefixes large enough for explicit
+# context caching are additionally uploaded once (see CACHED_PROMPT_PREFIXES); the
+# business context shared between layers is a few dozen tokens, far below the
+# 1,024-token cache minimum, so it is always sent inline.
+MARKET_ANALYSIS_PROMPT_PREFIX = f"""
+You are a senior market research analyst with 15+ years experience. Analyze the business described at the end of this prompt.
+
+Provide comprehensive market analysis:
+
+{MARKET_ANALYSIS_RUBRIC}
+
+Respond in this exact JSON format:
+{MARKET_ANALYSIS_SCHEMA}
+
+Be specific, data-driven, and actionable. Focus on insights that inform brand strategy.
+"""
+
+COMPETITIVE_ANALYSIS_PROMPT_PREFIX = f"""
+You are a competitive intelligence expert. Analyze the competitive landscape of the business described at the end of this prompt.
+
+Provide detailed competitive analysis:
+
+{COMPETITIVE_ANALYSIS_RUBRIC}
+
+Respond in this exact JSON format:
+{COMPETITIVE_ANALYSIS_SCHEMA}
+
+Focus on actionable insights for brand differentiation and positioning.
+"""
+
+PERSONALITY_ANALYSIS_PROMPT_PREFIX = f"""
+You are a brand psychology expert specializing in brand archetypes and personality development.
+
+Develop comprehensive brand personality for the business described at the end of this prompt:
+
+{PERSONALITY_ANALYSIS_RUBRIC}
+
+Respond in this exact JSON format:
+{PERSONALITY_ANALYSIS_SCHEMA}
+
+Ensure personality aligns with market opportunity and competitive positioning.
+"""
+
+VISUAL_BRIEF_PROMPT_PREFIX = f"""
+You are a creative director with expertise in visual brand identity and design strategy.
+
+Create comprehensive visual direction and creative brief for the business described at the end of this prompt:
+
+{VISUAL_BRIEF_RUBRIC}
+
+Respond in this exact JSON format:
+{VISUAL_BRIEF_SCHEMA}
+
+Ensure all visual direction aligns with brand personality and market positioning.
+"""
+
+STRATEGIC_SYNTHESIS_PROMPT_PREFIX = f"""
+You are a senior brand strategist synthesizing comprehensive brand strategy analysis.
+
+Create comprehensive strategic synthesis and recommendations for the business described at the end of this prompt:
+
+{STRATEGIC_SYNTHESIS_RUBRIC}
+
+Respond in this exact JSON format:
+{STRATEGIC_SYNTHESIS_SCHEMA}
 
 Provide actionable, strategic recommendations that integrate all analysis layers.
+"""
+
+SINGLE_SHOT_ANALYSIS_PROMPT_PREFIX = f"""
+You are a senior brand strategy team (market research analyst, competitive intelligence expert,
+brand psychologist, creative director and brand strategist) analyzing the business described at the end of this prompt.
+
+Work through the five layers below in order. Each later layer must build on the conclusions of the earlier ones.
+
+LAYER 1 - MARKET ANALYSIS ("market_intelligence"):
+{MARKET_ANALYSIS_RUBRIC}
+
+LAYER 2 - COMPETITIVE ANALYSIS ("competitive_positioning"):
+{COMPETITIVE_ANALYSIS_RUBRIC}
+
+LAYER 3 - BRAND PERSONALITY ("brand_personality"):
+{PERSONALITY_ANALYSIS_RUBRIC}
+
+LAYER 4 - VISUAL DIRECTION ("visual_direction"):
+{VISUAL_BRIEF_RUBRIC}
+
+LAYER 5 - STRATEGIC SYNTHESIS ("strategic_recommendations"):
+{STRATEGIC_SYNTHESIS_RUBRIC}
+
+Respond with a single JSON object with exactly these five keys, each following its layer's format:
+{{
+    "market_intelligence": {MARKET_ANALYSIS_SCHEMA},
+    "competitive_positioning": {COMPETITIVE_ANALYSIS_SCHEMA},
+    "brand_personality": {PERSONALITY_ANALYSIS_SCHEMA},
+    "visual_direction": {VISUAL_BRIEF_SCHEMA},
+    "strategic_recommendations": {STRATEGIC_SYNTHESIS_SCHEMA}
+}}
+
+Be specific, data-driven, and actionable. Ensure all layers are consistent with each other.
+"""
+
+PHASE2_STRATEGY_PROMPT_PREFIX = """
+You are an expert brand strategist with 20+ years of experience creating world-class brand strategies.
+You have access to comprehensive 5-layer strategic analysis, given at the end of this prompt. Create the most sophisticated brand strategy possible.
+
+Generate the most advanced brand strategy as a JSON object following the response schema.
+
+Make the strategy revolutionary, sophisticated, and perfectly aligned with all 5 layers of strategic analysis.
+This should be the most advanced brand strategy possible using AI-powered multi-layer intelligence.
+"""
+
+# Explicit context caching for long prompt prefixes: only prefixes comfortably above
+# Gemini's 1,024-token minimum qualify (about 4 characters per token), and cached
+# prefixes are refreshed a minute before their TTL runs out. When a cache cannot be
+# created, prefixes are sent inline for a while before creation is tried again.
+PROMPT_CACHE_MIN_CHARS = 6000
+PROMPT_CACHE_TTL_SECONDS = 3600
+PROMPT_CACHE_RETRY_SECONDS = 300
+CACHED_PROMPT_PREFIXES = tuple(
+    prefix for prefix in (
+        MARKET_ANALYSIS_PROMPT_PREFIX,
+        COMPETITIVE_ANALYSIS_PROMPT_PREFIX,
+        PERSONALITY_ANALYSIS_PROMPT_PREFIX,
+        VISUAL_BRIEF_PROMPT_PREFIX,
+        STRATEGIC_SYNTHESIS_PROMPT_PREFIX,
+        SINGLE_SHOT_ANALYSIS_PROMPT_PREFIX,
+        PHASE2_STRATEGY_PROMPT_PREFIX
+    )
+    if len(prefix) >= PROMPT_CACHE_MIN_CHARS
+)
+
+# Business-specific tails appended to each prompt prefix, filled with str.format_map
+MARKET_ANALYSIS_CONTEXT_TEMPLATE = """
+BUSINESS: {business_description}
+INDUSTRY: {industry}
+TARGET AUDIENCE: {target_audience}
+BUSINESS VALUES: {business_values}
+"""
+
+COMPETITIVE_ANALYSIS_CONTEXT_TEMPLATE = """
+BUSINESS CONTEXT: {business_description}
+INDUSTRY: {industry}
+TARGET MARKET: {target_audience}
+{market_context}"""
+
+PERSONALITY_ANALYSIS_CONTEXT_TEMPLATE = """
+BUSINESS CONTEXT: {business_description}
+INDUSTRY: {industry}
+TARGET AUDIENCE: {target_audience}
+BUSINESS VALUES: {business_values}
+MARKET INSIGHTS: {market_position}
+COMPETITIVE LANDSCAPE: {competitive_position}
+"""
+
+VISUAL_BRIEF_CONTEXT_TEMPLATE = """
+BUSINESS CONTEXT: {business_description}
+INDUSTRY: {industry}
+STYLE PREFERENCE: {preferred_style}
+COLOR PREFERENCE: {preferred_colors}
+BRAND PERSONALITY: {primary_archetype}
+PERSONALITY TRAITS: {core_traits}
+MARKET POSITION: {market_position}
+"""
+
+STRATEGIC_SYNTHESIS_CONTEXT_TEMPLATE = """
+BUSINESS CONTEXT: {business_description}
+
+SYNTHESIS INPUTS:
+MARKET INTELLIGENCE: {market_position}
+COMPETITIVE POSITIONING: {competitive_position}
+BRAND PERSONALITY: {primary_archetype}
+VISUAL DIRECTION: {visual_philosophy}
+"""
+
+SINGLE_SHOT_ANALYSIS_CONTEXT_TEMPLATE = """
+BUSINESS: {business_name}
+BUSINESS CONTEXT: {business_description}
+INDUSTRY: {industry}
+TARGET AUDIENCE: {target_audience}
+BUSINESS VALUES: {business_values}
+STYLE PREFERENCE: {preferred_style}
+COLOR PREFERENCE: {preferred_colors}
+"""
+
+PHASE2_STRATEGY_CONTEXT_TEMPLATE = """
+BUSINESS INFORMATION:
+- Name: {business_name}
+- Description: {business_description}
+- Industry: {industry}
+- Target Audience: {target_audience}
+- Values: {business_values}
+- Style Preference: {preferred_style}
+- Color Preference: {preferred_colors}
+
+ADVANCED STRATEGIC ANALYSIS (5 LAYERS):
+
+LAYER 1 - MARKET INTELLIGENCE:
+Market Position: {market_position}
+Growth Opportunities: {growth_opportunities}
+
+LAYER 2 - COMPETITIVE POSITIONING:
+Differentiation Strategy: {differentiation_strategy}
+Unique Value Props: {unique_value_props}
+
+LAYER 3 - BRAND PERSONALITY:
+Primary Archetype: {primary_archetype}
+Core Traits: {core_traits}
+
+LAYER 4 - VISUAL DIRECTION:
+Visual Philosophy: {visual_philosophy}
+Color Strategy: {color_strategy}
+
+LAYER 5 - STRATEGIC SYNTHESIS:
+Key Insights: {key_insights}
+Brand Promise: {brand_promise}
+"""
+
+# Fallback layer analyses for error scenarios, serialized once at import.
+# Decoding gives every caller its own dict without rebuilding the literals.
+FALLBACK_MARKET_ANALYSIS = orjson.dumps({
+    "market_size_analysis": {
+        "total_addressable_market": "Growing market with digital transformation opportunities",
+        "growth_trends": ["Digital adoption", "Customer experience focus", "Efficiency demands"],
+        "market_drivers": ["Technology advancement", "Changing customer expectations", "Competitive pressure"]
+    },
+    "industry_dynamics": {
+        "major_trends": ["Digital transformation", "Customer-centric approaches", "Innovation focus"],
+        "regulatory_environment": "Standard industry regulations apply",
+        "technology_disruptions": ["AI integration", "Automation", "Digital platforms"],
+        "industry_challenges": ["Market competition", "Technology adoption", "Customer retention"]
+    },
+    "target_audience_insights": {
+        "demographics": "Professional decision-makers and end users",
+        "psychographics": "Value-driven, efficiency-focused, quality-conscious",
+        "pain_points": ["Time constraints", "Quality concerns", "Cost considerations"],
+        "buying_behavior": "Research-driven decision making with emphasis on proven results",
+        "unmet_needs": ["Simplified solutions", "Better integration", "Improved outcomes"]
+    },
+    "market_opportunities": {
+        "underserved_segments": ["Small to medium businesses", "Emerging markets"],
+        "emerging_trends": ["Sustainability focus", "Remote solutions", "Personalization"],
+        "partnership_opportunities": ["Technology providers", "Industry associations"],
+        "market_gaps": ["Affordable premium solutions", "Integrated platforms"]
+    },
+    "positioning_recommendations": {
+        "optimal_position": "Innovative leader delivering exceptional value",
+        "value_proposition_focus": "Quality, innovation, and trusted expertise",
+        "differentiation_strategy": "Superior results through innovative approaches",
+        "positioning_statement": "The trusted partner for innovative excellence"
+    },
+    "confidence_score": 0.75
+})
+
+FALLBACK_COMPETITIVE_ANALYSIS = orjson.dumps({
+    "competitive_landscape": {
+        "direct_competitors": [
+            {"name": "Market Leader A", "market_share": "25%", "strengths": ["Brand recognition", "Market presence"]},
+            {"name": "Challenger B", "market_share": "15%", "strengths": ["Innovation", "Customer service"]},
+            {"name": "Specialist C", "market_share": "10%", "strengths": ["Expertise", "Specialization"]}
+        ],
+        "indirect_competitors": ["Alternative solutions", "In-house options", "Generic providers"],
+        "competitive_intensity": "Moderate to high with opportunities for differentiation"
+    },
+    "competitor_analysis": {
+        "market_leaders": ["Established Player 1", "Established Player 2"],
+        "brand_strength_ranking": ["Leader A", "Challenger B", "Specialist C"],
+        "competitive_advantages_by_player": {
+            "Leader A": ["Market presence", "Resources"],
+            "Challenger B": ["Innovation", "Agility"]
+        }
+    },
+    "market_gaps": {
+        "unmet_customer_needs": ["Better integration", "Simplified solutions", "Personal touch"],
+        "service_gaps": ["Customization", "Support quality", "Value pricing"],
+        "positioning_white_spaces": ["Premium affordable", "Innovative traditional"],
+        "underserved_segments": ["Small business", "Emerging sectors"]
+    },
+    "differentiation_strategy": {
+        "unique_value_propositions": ["Superior outcomes", "Innovative approach", "Trusted partnership"],
+        "competitive_moats": ["Expertise depth", "Customer relationships", "Innovation capability"],
+        "positioning_against_competition": "Premium quality with accessible approach",
+        "differentiation_pillars": ["Innovation", "Quality", "Service", "Results"]
+    },
+    "strategic_recommendations": {
+        "competitive_response_strategies": ["Focus on differentiation", "Build customer loyalty"],
+        "market_entry_tactics": ["Value demonstration", "Strategic partnerships"],
+        "brand_positioning_strategy": "Position as innovative leader with proven results",
+        "competitive_messaging": "Emphasize unique value and proven outcomes"
+    },
+    "confidence_score": 0.70
+})
+
+FALLBACK_PERSONALITY_ANALYSIS = orjson.dumps({
+    "brand_archetype": {
+        "primary_archetype": "The Innovator",
+        "secondary_influences": ["The Expert", "The Caregiver"],
+        "archetype_justification": "Fits market need for innovative solutions with trusted expertise",
+        "archetype_characteristics": ["Forward-thinking", "Problem-solving", "Reliable", "Creative"]
+    },
+    "personality_traits": {
+        "core_traits": [
+            {"trait": "Innovative", "description": "Forward-thinking and creative", "expression": "Shows up in solutions and approaches"},
+            {"trait": "Trustworthy", "description": "Reliable and dependable", "expression": "Consistent delivery and communication"},
+            {"trait": "Professional", "description": "Expert and competent", "expression": "Quality work and professional standards"},
+            {"trait": "Approachable", "description": "Accessible and friendly", "expression": "Easy to work with and understand"},
+            {"trait": "Results-focused", "description": "Outcome-oriented", "expression": "Clear delivery and measurable success"}
+        ],
+        "personality_summary": "An innovative yet trustworthy brand that combines expertise with approachability"
+    },
+    "brand_voice": {
+        "communication_style": "Professional confidence balanced with approachable expertise",
+        "tone_variations": {
+            "formal_contexts": "Professional and authoritative",
+            "casual_contexts": "Friendly and helpful",
+            "crisis_contexts": "Calm and reassuring"
+        },
+        "language_patterns": ["Clear communication", "Action-oriented", "Solution-focused"],
+        "vocabulary_preferences": ["Positive", "Professional", "Accessible"]
+    },
+    "brand_values_beliefs": {
+        "core_values": ["Innovation", "Quality", "Trust", "Excellence", "Partnership"],
+        "brand_purpose": "To drive success through innovative excellence",
+        "mission_statement": "Delivering exceptional outcomes through innovative solutions",
+        "belief_system": ["Quality matters", "Innovation drives progress", "Trust builds relationships"],
+        "worldview": "Success comes from combining innovation with proven expertise"
+    },
+    "relationship_dynamics": {
+        "customer_relationship_model": "Trusted advisor and strategic partner",
+        "trust_building_approach": "Consistent delivery and transparent communication",
+        "credibility_factors": ["Proven results", "Expert knowledge", "Professional approach"],
+        "relationship_goals": ["Long-term partnership", "Mutual success"]
+    },
+    "emotional_positioning": {
+        "primary_emotions": ["Confidence", "Trust", "Aspiration"],
+        "emotional_journey": {
+            "awareness": "Curiosity and interest",
+            "consideration": "Confidence and trust",
+            "purchase": "Excitement and commitment",
+            "loyalty": "Satisfaction and advocacy"
+        },
+        "feeling_differentiation": "Trusted innovation partner vs. just another service provider"
+    },
+    "confidence_score": 0.85
+})
+
+FALLBACK_VISUAL_BRIEF = orjson.dumps({
+    "visual_strategy": {
+        "visual_philosophy": "Clean, professional design that conveys innovation and trust",
+        "visual_personality_expression": "Modern sophistication with approachable professionalism",
+        "visual_goals": ["Build trust", "Convey expertise", "Show innovation"],
+        "brand_visual_positioning": "Premium quality with accessible approach"
+    },
+    "design_system": {
+        "primary_design_principles": ["Clarity", "Consistency", "Quality"],
+        "visual_hierarchy": "Clear information architecture with strategic emphasis",
+        "design_components": ["Typography", "Color", "Imagery", "Layout"],
+        "consistency_framework": "Unified visual language across all touchpoints"
+    },
+    "color_strategy": {
+        "strategic_palette": [
+            {"color": "Primary Blue", "hex": "#2563eb", "psychology": "Trust and professionalism", "usage": "Main brand elements"},
+            {"color": "Secondary Blue", "hex": "#1e40af", "psychology": "Depth and reliability", "usage": "Supporting elements"},
+            {"color": "Accent Blue", "hex": "#3b82f6", "psychology": "Innovation and energy", "usage": "Highlights and calls to action"},
+            {"color": "Light Blue", "hex": "#60a5fa", "psychology": "Accessibility and friendliness", "usage": "Secondary accents"},
+            {"color": "Neutral", "hex": "#f8fafc", "psychology": "Clean and professional", "usage": "Backgrounds and text"}
+        ],
+        "color_psychology_rationale": "Blue conveys trust and professionalism while maintaining innovation feel",
+        "color_combinations": "Primary with neutrals for authority, accents for energy"
+    },
+    "typography_strategy": {
+        "typography_personality": "Clean, readable, and professional with modern feel",
+        "font_selection_criteria": "Legibility, professionalism, modern appearance",
+        "typographic_hierarchy": {
+            "primary_heading": "Bold, clear, authoritative",
+            "secondary_heading": "Supporting, professional",
+            "body_text": "Clean, readable, accessible",
+            "accent_text": "Strategic emphasis elements"
+        },
+        "typography_applications": "Consistent hierarchy across all brand materials"
+    },
+    "imagery_direction": {
+        "photography_style": "Professional, high-quality, authentic",
+        "illustration_style": "Clean, modern, purposeful when needed",
+        "visual_content_strategy": "Support brand story with quality visuals",
+        "mood_aesthetic": "Professional confidence with approachable warmth",
+        "visual_storytelling": "Show expertise and results through visual narrative"
+    },
+    "logo_identity_brief": {
+        "logo_design_direction": "Simple, memorable, scalable design",
+        "identity_system_requirements": "Flexible system for all applications",
+        "logo_personality_expression": "Innovation balanced with trustworthiness",
+        "application_considerations": "Digital and print, various sizes and contexts",
+        "logo_effectiveness_criteria": "Recognition, memorability, appropriate personality"
+    },
+    "confidence_score": 0.80
+})
+
+FALLBACK_STRATEGIC_SYNTHESIS = orjson.dumps({
+    "strategic_insights": {
+        "key_insights": ["Market opportunity exists", "Differentiation is key", "Trust builds success", "Innovation drives growth"],
+        "strategic_themes": ["Innovation leadership", "Trusted expertise", "Quality delivery"],
+        "critical_success_factors": ["Brand differentiation", "Customer trust", "Quality delivery"],
+        "strategic_opportunities": ["Market leadership", "Customer loyalty"]
+    },
+    "brand_strategy_framework": {
+        "unified_strategy": "Innovative leader delivering exceptional results through trusted expertise",
+        "positioning_statement": "The trusted partner for innovative excellence and exceptional outcomes",
+        "strategy_pillars": ["Innovation", "Trust", "Quality", "Results"],
+        "brand_promise": "Exceptional outcomes through innovative excellence",
+        "unique_value_proposition": "Proven results through innovative approaches and trusted expertise"
+    },
+    "implementation_roadmap": {
+        "phase_1_immediate": {
+            "timeline": "0-3 months",
+            "priorities": ["Brand foundation", "Visual identity", "Key messaging"],
+            "deliverables": ["Brand guidelines", "Visual assets"]
+        },
+        "phase_2_build": {
+            "timeline": "3-9 months",
+            "priorities": ["Market presence", "Customer experience", "Brand consistency"],
+            "deliverables": ["Marketing materials", "Customer touchpoints"]
+        },
+        "phase_3_optimize": {
+            "timeline": "9-18 months",
+            "priorities": ["Brand optimization", "Market expansion"],
+            "deliverables": ["Performance analytics", "Brand evolution"]
+        }
+    },
+    "success_measurement": {
+        "kpis": ["Brand awareness", "Customer satisfaction", "Market share", "Brand perception"],
+        "success_metrics": {
+            "brand_awareness": "Measure recognition and recall",
+            "brand_perception": "Track brand attributes and sentiment",
+            "business_impact": "Monitor business growth and customer metrics"
+        },
+        "measurement_frequency": "Quarterly assessment with annual comprehensive review"
+    },
+    "strategic_recommendations": {
+        "immediate_actions": ["Establish brand foundation", "Create consistent messaging", "Develop visual identity"],
+        "long_term_initiatives": ["Build market leadership", "Expand customer base"],
+        "risk_mitigation": ["Monitor competitive response", "Maintain quality standards"],
+        "competitive_response": "Focus on differentiation and customer value"
+    },
+    "confidence_score": 0.78
+})
+
+# Industry-independent parts of the Phase 2 fallback strategy; brand_essence,
+# tagline and brand_story are filled in per business
+FALLBACK_PHASE2_STRATEGY = orjson.dumps({
+    "brand_personality": {
+        "primary_traits": ["innovative", "trustworthy", "professional", "forward-thinking", "reliable"],
+        "brand_archetype": "The Innovator",
+        "tone_of_voice": "Professional yet approachable, confident and knowledgeable",
+        "brand_essence": None,
+        "emotional_drivers": ["trust", "confidence", "aspiration"],
+        "personality_expression": "Consistent professional excellence across all touchpoints"
+    },
+    "visual_direction": {
+        "design_style": "Modern, clean, and sophisticated with strategic use of space",
+        "visual_mood": "Professional confidence with innovative edge",
+        "typography_strategy": "Clean, readable fonts that convey authority and accessibility",
+        "imagery_style": "High-quality, professional imagery that tells the brand story",
+        "logo_direction": "Simple, memorable, scalable design that works across all applications",
+        "layout_principles": "Clean hierarchy, strategic whitespace, consistent alignment",
+        "visual_consistency_framework": "Cohesive visual language across all brand touchpoints"
+    },
+    "color_palette": ["#2563eb", "#1e40af", "#3b82f6", "#60a5fa", "#f8fafc"],
+    "messaging_framework": {
+        "tagline": None,
+        "key_messages": ["Innovation Leadership", "Trusted Expertise", "Exceptional Results"],
+        "brand_promise": "Delivering innovative solutions that drive exceptional outcomes",
+        "unique_value_proposition": "Your strategic partner for breakthrough success",
+        "brand_story": None,
+        "messaging_hierarchy": "Innovation first, trust builds, results deliver"
+    },
+    "consistency_rules": {
+        "logo_usage": "Primary logo on light backgrounds, reversed logo on dark backgrounds",
+        "color_usage": "Primary blue for key elements, supporting palette for hierarchy",
+        "typography_rules": "Consistent font hierarchy with clear information architecture",
+        "visual_consistency": "Maintain sophisticated professional appearance across all materials",
+        "brand_voice_consistency": "Professional confidence balanced with approachable expertise",
+        "touchpoint_consistency": "Seamless brand experience across all customer interactions"
+    },
+    "advanced_analysis": {
+        "market_intelligence": {"confidence_score": 0.75},
+        "competitive_positioning": {"confidence_score": 0.70},
+        "brand_personality": {"confidence_score": 0.85},
+        "visual_direction": {"confidence_score": 0.80},
+        "strategic_recommendations": {"confidence_score": 0.78}
+    }
+})
+
+@lru_cache(maxsize=None)
+def _response_json_schema(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON Schema for a response model, generated once per model and sent with each request"""
+    return schema.model_json_schema()
+
+@lru_cache(maxsize=None)
+def _response_schema_digest(schema: Optional[Type[BaseModel]]) -> str:
+    """Digest of the response schema a request is sent with, part of the reply cache key"""
+    if schema is None:
+        return ""
+    return hashlib.blake2b(
+        orjson.dumps(_response_json_schema(schema), option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+
+class AnalysisLayer(NamedTuple):
+    """Everything needed to run one analysis layer as its own Gemini call"""
+    prompt_prefix: str
+    context_template: str
+    schema: Type[BaseModel]
+    output_tokens: int
+    fallback: bytes
+    label: str
+
+# Layer dispatch table, keyed like the analysis result sections
+ANALYSIS_LAYERS = {
+    "market_intelligence": AnalysisLayer(
+        MARKET_ANALYSIS_PROMPT_PREFIX, MARKET_ANALYSIS_CONTEXT_TEMPLATE, MarketAnalysis,
+        MARKET_ANALYSIS_OUTPUT_TOKENS, FALLBACK_MARKET_ANALYSIS, "market analysis"
+    ),
+    "competitive_positioning": AnalysisLayer(
+        COMPETITIVE_ANALYSIS_PROMPT_PREFIX, COMPETITIVE_ANALYSIS_CONTEXT_TEMPLATE, CompetitiveAnalysis,
+        COMPETITIVE_ANALYSIS_OUTPUT_TOKENS, FALLBACK_COMPETITIVE_ANALYSIS, "competitive analysis"
+    ),
+    "brand_personality": AnalysisLayer(
+        PERSONALITY_ANALYSIS_PROMPT_PREFIX, PERSONALITY_ANALYSIS_CONTEXT_TEMPLATE, PersonalityAnalysis,
+        PERSONALITY_ANALYSIS_OUTPUT_TOKENS, FALLBACK_PERSONALITY_ANALYSIS, "brand personality development"
+    ),
+    "visual_direction": AnalysisLayer(
+        VISUAL_BRIEF_PROMPT_PREFIX, VISUAL_BRIEF_CONTEXT_TEMPLATE, VisualBrief,
+        VISUAL_BRIEF_OUTPUT_TOKENS, FALLBACK_VISUAL_BRIEF, "visual brief creation"
+    ),
+    "strategic_recommendations": AnalysisLayer(
+        STRATEGIC_SYNTHESIS_PROMPT_PREFIX, STRATEGIC_SYNTHESIS_CONTEXT_TEMPLATE, StrategicSynthesis,
+        STRATEGIC_SYNTHESIS_OUTPUT_TOKENS, FALLBACK_STRATEGIC_SYNTHESIS, "strategic synthesis"
+    )
+}
+
+class AdvancedBrandStrategyEngine:
+    """Phase 2: Advanced Multi-Layer AI Strategy Engine using Gemini AI with sophisticated strategic reasoning"""
+    
+    # Circuit breaker state, shared by all engine instances
+    _consecutive_failures = 0
+    _circuit_open_until = 0.0
+    
+    # Concurrency limiter and prompt cache lock per event loop: asyncio primitives bind to
+    # the loop that first uses them, so one class-level instance breaks under a second loop
+    _loop_primitives: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[asyncio.Semaphore, asyncio.Lock]]" = weakref.WeakKeyDictionary()
+    
+    # Explicit context caches for long prompt prefixes, shared by all engine instances:
+    # (model, prefix) -> (cache name, monotonic refresh deadline)
+    _prompt_caches: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+    
+    def __init__(self):
+        self.gemini_model = "gemini-2.5-flash"
+        self.analysis_layers = 5
+        self._response_cache: Dict[str, bytes] = {}
+        self._inflight_requests: Dict[str, asyncio.Future] = {}
+        self._analysis_cache: Dict[str, bytes] = {}
+        # Strong references to background prefetches so they are not garbage collected mid-flight
+        self._prefetch_tasks: Set[asyncio.Task] = set()
+        
+    @property
+    def client(self):
+        """Shared Gemini client, created on first use so importing and constructing the engine stay cheap"""
+        return get_gemini_client()
+    
+    @classmethod
+    def _gemini_semaphore(cls) -> asyncio.Semaphore:
+        """Gemini concurrency limiter for the running event loop"""
+        return cls._running_loop_primitives()[0]
+    
+    @classmethod
+    def _prompt_cache_lock(cls) -> asyncio.Lock:
+        """Prompt cache creation lock for the running event loop"""
+        return cls._running_loop_primitives()[1]
+    
+    @classmethod
+    def _running_loop_primitives(cls) -> Tuple[asyncio.Semaphore, asyncio.Lock]:
+        """Create the running loop's semaphore and lock on first use"""
+        loop = asyncio.get_running_loop()
+        primitives = cls._loop_primitives.get(loop)
+        if primitives is None:
+            primitives = cls._loop_primitives[loop] = (asyncio.Semaphore(GEMINI_MAX_CONCURRENCY), asyncio.Lock())
+        return primitives
+    
+    def prefetch_analysis(self, business_input: BusinessInput) -> asyncio.Task:
+        """Start the strategic analysis in the background as soon as a business input is accepted
+        
+        The finished analysis lands in the analysis cache, and a strategy request that
+        arrives while it is still running joins the in-flight Gemini call instead of
+        issuing its own.
         """
         
+        task = asyncio.create_task(self.analyze_business_concept(business_input))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._on_prefetch_done)
+        return task
+    
+    def _on_prefetch_done(self, task: asyncio.Task) -> None:
+        """Release a finished prefetch, logging its failure instead of leaving it unretrieved"""
+        
+        self._prefetch_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning("⚠️ Strategic analysis prefetch failed: %s", task.exception())
+    
+    async def analyze_business_concept(self, business_input: BusinessInput) -> Dict[str, Any]:
+        """Revolutionary 5-Layer Strategic Analysis System"""
+        
+        cache_key = self._analysis_cache_key(business_input)
+        cached_analysis = self._analysis_cache.get(cache_key)
+        if cached_analysis is not None:
+            # Decoded per hit so callers never share (and mutate) one analysis dict
+            return orjson.loads(cached_analysis)
+        
+        # All five layers in one Gemini call; the layered pipeline reruns only
+        # the layers whose section of the combined reply was missing or invalid
+        known_layers = await self._analyze_business_concept_single_shot(business_input)
+        # Layered results may contain generic fallback layers, so only complete
+        # single-shot analyses are cached
+        cacheable = len(known_layers) == len(ANALYSIS_LAYER_KEYS)
+        if cacheable:
+            layers = tuple(known_layers[key] for key in ANALYSIS_LAYER_KEYS)
+        else:
+            layers = await self._analyze_business_concept_layered(business_input, known_layers)
+        
+        market_analysis, competitive_analysis, personality_analysis, visual_brief, strategic_synthesis = layers
+        
+        analysis = {
+            "market_intelligence": market_analysis,
+            "competitive_positioning": competitive_analysis,
+            "brand_personality": personality_analysis,
+            "visual_direction": visual_brief,
+            "strategic_recommendations": strategic_synthesis,
+            "confidence_scores": self.calculate_analysis_confidence(
+                market_analysis, competitive_analysis, personality_analysis, visual_brief, strategic_synthesis
+            )
+        }
+        
+        if cacheable:
+            self._store_bounded(self._analysis_cache, cache_key, orjson.dumps(analysis), ANALYSIS_CACHE_SIZE)
+        
+        return analysis
+    
+    @staticmethod
+    def _analysis_cache_key(business_input: BusinessInput) -> str:
+        """Digest of the business input and analysis schema version"""
+        
+        canonical_input = orjson.dumps(business_input.model_dump(), option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(
+            ANALYSIS_SCHEMA_VERSION.encode() + b"\x00" + canonical_input, digest_size=16
+        ).hexdigest()
+    
+    @staticmethod
+    def _store_bounded(cache: Dict[str, Any], key: str, value: Any, max_size: int) -> None:
+        """Insert into a size-bounded cache, evicting the oldest entry (dicts preserve insertion order)"""
+        
+        if key not in cache and len(cache) >= max_size:
+            del cache[next(iter(cache))]
+        cache[key] = value
+    
+    async def _analyze_business_concept_single_shot(self, business_input: BusinessInput) -> Dict[str, Dict[str, Any]]:
+        """Run all five analysis layers in a single Gemini call, returning the layers whose sections validate"""
+        
         try:
-            response = await asyncio.get_event_loop().run_in_executor(None,
-                lambda: self.client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=synthesis_prompt
-                )
+            analysis = await self._generate_json(
+                self._build_single_shot_analysis_prompt(business_input), output_tokens=SINGLE_SHOT_ANALYSIS_OUTPUT_TOKENS
             )
+        except Exception as e:
+            logging.warning("⚠️ Single-shot strategic analysis failed, falling back to layered analysis: %s", e)
+            return {}
+        
+        # Valid JSON is not necessarily an object; anything else reruns every layer
+        if not isinstance(analysis, dict):
+            logging.warning("⚠️ Single-shot strategic analysis returned %s instead of an object, falling back to layered analysis", type(analysis).__name__)
+            return {}
+        
+        # Sections are validated one by one so a single malformed section
+        # costs one layered call instead of all five
+        known_layers = {}
+        for key in ANALYSIS_LAYER_KEYS:
+            try:
+                known_layers[key] = ANALYSIS_LAYERS[key].schema.model_validate(analysis.get(key)).model_dump()
+            except ValidationError as e:
+                logging.warning("⚠️ Single-shot %s section invalid, rerunning that layer: %s", key, e)
+        
+        return known_layers
+    
+    async def _analyze_business_concept_layered(self, business_input: BusinessInput,
+                                                known_layers: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[Dict[str, Any], ...]:
+        """Run the five analysis layers as separate Gemini calls, feeding each layer into the next
+        
+        Layers already present in known_layers (from a partially valid single-shot reply) are reused.
+        """
+        
+        known_layers = known_layers or {}
+        
+        async def reuse_or_run(layer_key: str, run_layer) -> Dict[str, Any]:
+            known_layer = known_layers.get(layer_key)
+            return known_layer if known_layer is not None else await run_layer()
+        
+        # Layers 1 & 2: Market Analysis and Competitive Landscape are independent,
+        # so both Gemini calls run concurrently. return_exceptions keeps one layer's
+        # failure from abandoning the other mid-flight; failed layers use their fallback.
+        market_analysis, competitive_analysis = await asyncio.gather(
+            reuse_or_run("market_intelligence", lambda: self.analyze_market_position(business_input)),
+            reuse_or_run("competitive_positioning", lambda: self.analyze_competitive_landscape(business_input)),
+            return_exceptions=True
+        )
+        if isinstance(market_analysis, Exception):
+            market_analysis = self._layer_fallback("market_intelligence", market_analysis)
+        if isinstance(competitive_analysis, Exception):
+            competitive_analysis = self._layer_fallback("competitive_positioning", competitive_analysis)
+        
+        # Layer 3: Brand Personality & Archetype Development
+        personality_analysis = await reuse_or_run("brand_personality", lambda: self.develop_brand_personality(
+            business_input, market_analysis, competitive_analysis
+        ))
+        
+        # Layer 4: Visual Direction & Creative Brief
+        visual_brief = await reuse_or_run("visual_direction", lambda: self.create_visual_brief(
+            personality_analysis, market_analysis, business_input
+        ))
+        
+        # Layer 5: Strategic Synthesis & Recommendations
+        strategic_synthesis = await reuse_or_run("strategic_recommendations", lambda: self.synthesize_strategy(
+            market_analysis, competitive_analysis, personality_analysis, visual_brief, business_input
+        ))
+        
+        return market_analysis, competitive_analysis, personality_analysis, visual_brief, strategic_synthesis
+    
+    def _build_single_shot_analysis_prompt(self, business_input: BusinessInput) -> str:
+        """Build the combined prompt covering all five analysis layers"""
+        
+        return SINGLE_SHOT_ANALYSIS_PROMPT_PREFIX + SINGLE_SHOT_ANALYSIS_CONTEXT_TEMPLATE.format_map(
+            business_input.prompt_fields
+        )
+    
+    async def generate_comprehensive_strategy(self, business_input: BusinessInput) -> BrandStrategy:
+        """Generate comprehensive brand strategy using Phase 2 advanced multi-layer analysis"""
+        
+        # Get revolutionary 5-layer analysis
+        analysis = await self.analyze_business_concept(business_input)
+        
+        # Build final strategy from all analysis layers
+        strategy_prompt = self._build_phase2_strategy_prompt(business_input, analysis)
+        
+        try:
+            strategy_data = await self._generate_json(strategy_prompt, StrategyDraft, PHASE2_STRATEGY_OUTPUT_TOKENS)
+            
+            # Create BrandStrategy object with Phase 2 enhanced data; the reply was
+            # already validated against StrategyDraft, so its sections map directly
+            brand_strategy = BrandStrategy.model_validate({
+                **strategy_data,
+                "business_name": business_input.business_name,
+                "advanced_analysis": analysis  # Include all Phase 2 analysis data
+            })
             
-            response_text = response.text.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
+            return brand_strategy
             
-            return json.loads(response_text)
+        except Exception as e:
+            logging.error("Error generating Phase 2 comprehensive brand strategy: %s", e)
+            # Enhanced fallback with Phase 2 capabilities
+            return await self._generate_phase2_fallback_strategy(business_input)
+
+    async def _generate_json(self, prompt: str, schema: Optional[Type[BaseModel]] = None,
+                             output_tokens: int = PHASE2_STRATEGY_OUTPUT_TOKENS) -> Dict[str, Any]:
+        """Send a prompt to Gemini and parse the JSON reply, reusing cached replies for identical prompts"""
+        
+        cache_key = self._response_cache_key(prompt, output_tokens, schema)
+        cached_data = self._response_cache.get(cache_key)
+        if cached_data is not None:
+            # Stored already validated, so a hit skips schema validation entirely
+            return orjson.loads(cached_data)
+        
+        # Concurrent callers with the same prompt share one in-flight Gemini call
+        request = self._inflight_requests.get(cache_key)
+        if request is None:
+            request = asyncio.ensure_future(self._call_gemini(
+                prompt, output_tokens, _response_json_schema(schema) if schema is not None else None
+            ))
+            self._inflight_requests[cache_key] = request
+            request.add_done_callback(lambda _: self._inflight_requests.pop(cache_key, None))
+        
+        # Shielded so one caller being cancelled does not cancel the call for the others
+        response_text = await asyncio.shield(request)
+        
+        # Parse before caching so malformed replies are retried on the next call
+        data = self._parse_json_response(response_text, schema)
+        
+        if cache_key not in self._response_cache:
+            self._store_bounded(self._response_cache, cache_key, orjson.dumps(data), RESPONSE_CACHE_SIZE)
+        
+        return data
+    
+    def _response_cache_key(self, prompt: str, output_tokens: int,
+                            schema: Optional[Type[BaseModel]] = None) -> str:
+        """Digest identifying a Gemini request; prompts differing only in whitespace share a key
+        
+        The response schema is part of the key, since the same prompt text can be
+        sent with different schemas and a reply shaped for one must not serve another.
+        
+        Case is kept: names and descriptions are echoed back in the reply, so
+        "ACME" and "Acme" must not share a cached strategy.
+        """
+        
+        normalized_prompt = WHITESPACE_PATTERN.sub(' ', prompt).strip()
+        return hashlib.blake2b(
+            f"{self.gemini_model}\x00{output_tokens}\x00{_response_schema_digest(schema)}\x00{normalized_prompt}".encode(), digest_size=16
+        ).hexdigest()
+    
+    async def _call_gemini(self, prompt: str, output_tokens: int,
+                           response_json_schema: Optional[Dict[str, Any]] = None) -> str:
+        """Call Gemini, retrying transient failures with jittered exponential backoff behind a shared circuit breaker"""
+        
+        engine_cls = type(self)
+        if time.monotonic() < engine_cls._circuit_open_until:
+            raise RuntimeError("Gemini circuit breaker is open, skipping call")
+        
+        for attempt in range(1, GEMINI_MAX_ATTEMPTS + 1):
+            try:
+                semaphore = engine_cls._gemini_semaphore()
+                if semaphore.locked():
+                    # Frequent queuing means LLM_MAX_CONCURRENCY is below the request load
+                    logging.info("Gemini concurrency limit (%s) reached, queuing call", GEMINI_MAX_CONCURRENCY)
+                # Held only for the call itself, so backoff sleeps don't occupy a slot
+                async with semaphore:
+                    try:
+                        response_text = await asyncio.wait_for(
+                            self._stream_gemini_text(prompt, output_tokens, response_json_schema),
+                            timeout=GEMINI_TIMEOUT_SECONDS
+                        )
+                    except TimeoutError:
+                        # wait_for's TimeoutError has no message; name the deadline in the logs
+                        raise TimeoutError(f"Gemini call timed out after {GEMINI_TIMEOUT_SECONDS:g}s") from None
+            except Exception as e:
+                if not self._is_transient_error(e):
+                    raise
+                
+                engine_cls._consecutive_failures += 1
+                if engine_cls._consecutive_failures >= CIRCUIT_BREAKER_FAILURE_THRESHOLD:
+                    engine_cls._circuit_open_until = time.monotonic() + CIRCUIT_BREAKER_RESET_SECONDS
+                    logging.error("❌ Gemini circuit breaker opened for %ss after %s consecutive failures", CIRCUIT_BREAKER_RESET_SECONDS, engine_cls._consecutive_failures)
+                    raise
+                if attempt == GEMINI_MAX_ATTEMPTS:
+                    raise
+                
+                delay = min(GEMINI_RETRY_MAX_DELAY, GEMINI_RETRY_BASE_DELAY * 2 ** (attempt - 1)) + random.uniform(0, 0.5)
+                server_delay = self._server_retry_delay(e)
+                if server_delay is not None:
+                    # Retrying before the server's requested delay would just be rejected again
+                    delay = max(delay, min(server_delay, GEMINI_RETRY_MAX_DELAY))
+                logging.warning("⚠️ Transient Gemini error (attempt %s/%s), retrying in %.1fs: %s", attempt, GEMINI_MAX_ATTEMPTS, delay, e)
+                await asyncio.sleep(delay)
+                continue
+            
+            engine_cls._consecutive_failures = 0
+            return response_text
+    
+    async def _stream_gemini_text(self, prompt: str, output_tokens: int,
+                                  response_json_schema: Optional[Dict[str, Any]] = None) -> str:
+        """Stream a Gemini reply on the event loop and join its text chunks once the stream ends"""
+        
+        config = {
+            "temperature": STRUCTURED_TEMPERATURE,
+            "response_mime_type": "application/json",
+            "max_output_tokens": output_tokens + THINKING_BUDGET_TOKENS,
+            "thinking_config": {"thinking_budget": THINKING_BUDGET_TOKENS}
+        }
+        if response_json_schema is not None:
+            # Server-side enforcement of the required sections; the prompt's
+            # schema block still describes the fields expected inside them
+            config["response_json_schema"] = response_json_schema
+        
+        contents = prompt
+        prefix = next((prefix for prefix in CACHED_PROMPT_PREFIXES if prompt.startswith(prefix)), None)
+        cache_name = await self._prompt_cache_name(prefix) if prefix is not None else None
+        if cache_name is not None:
+            # The cached prefix is billed at the cached-token rate; only the tail is sent
+            config["cached_content"] = cache_name
+            contents = prompt[len(prefix):]
+        
+        try:
+            return await self._join_gemini_stream(contents, config)
+        except Exception as e:
+            if cache_name is None or self._is_transient_error(e):
+                raise
+            # Most likely the cache expired or was deleted server-side: forget it
+            # (the next call recreates it) and resend this call with the prefix inline
+            logging.warning("⚠️ Gemini call on cached prompt prefix failed, resending inline: %s", e)
+            type(self)._prompt_caches.pop((self.gemini_model, prefix), None)
+            del config["cached_content"]
+            return await self._join_gemini_stream(prompt, config)
+    
+    async def _join_gemini_stream(self, contents: str, config: Dict[str, Any]) -> str:
+        """Run one streaming Gemini request and join its text chunks"""
+        
+        # Native async streaming: no worker thread is held while tokens arrive
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.gemini_model,
+            contents=contents,
+            config=config
+        )
+        chunks = [chunk.text async for chunk in stream if chunk.text]
+        # No .strip(): orjson and pydantic-core skip surrounding whitespace themselves
+        return ''.join(chunks)
+    
+    async def _prompt_cache_name(self, prefix: str) -> Optional[str]:
+        """Name of the explicit context cache holding a prompt prefix, creating it if needed
+        
+        Returns None when the cache cannot be created, so the prefix is sent inline; the
+        failure is remembered for PROMPT_CACHE_RETRY_SECONDS so later calls don't queue
+        on the lock behind another failing round trip.
+        """
+        
+        engine_cls = type(self)
+        cache_key = (self.gemini_model, prefix)
+        entry = engine_cls._prompt_caches.get(cache_key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        
+        async with engine_cls._prompt_cache_lock():
+            # Another caller may have created it while this one waited for the lock
+            entry = engine_cls._prompt_caches.get(cache_key)
+            if entry is not None and time.monotonic() < entry[1]:
+                return entry[0]
+            
+            try:
+                cached_content = await self.client.aio.caches.create(
+                    model=self.gemini_model,
+                    config={"contents": [prefix], "ttl": f"{PROMPT_CACHE_TTL_SECONDS}s"}
+                )
+            except Exception as e:
+                logging.warning("⚠️ Could not create Gemini prompt cache, sending prefix inline for %ss: %s", PROMPT_CACHE_RETRY_SECONDS, e)
+                engine_cls._prompt_caches[cache_key] = (None, time.monotonic() + PROMPT_CACHE_RETRY_SECONDS)
+                return None
+            
+            engine_cls._prompt_caches[cache_key] = (cached_content.name, time.monotonic() + PROMPT_CACHE_TTL_SECONDS - 60)
+            return cached_content.name
+    
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """Whether a Gemini call failure is worth retrying (rate limits, server errors, network faults)"""
+        
+        from google.genai import errors as genai_errors
+        
+        if isinstance(error, genai_errors.APIError):
+            return error.code in TRANSIENT_STATUS_CODES
+        return isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError))
+    
+    @staticmethod
+    def _server_retry_delay(error: Exception) -> Optional[float]:
+        """Delay (seconds) the Gemini API asked for before retrying, from Retry-After or RetryInfo"""
+        
+        from google.genai import errors as genai_errors
+        
+        if not isinstance(error, genai_errors.APIError):
+            return None
+        
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+        if retry_after is None and isinstance(error.details, dict):
+            # google.rpc.RetryInfo detail, e.g. {"retryDelay": "37s"}
+            for detail in error.details.get("error", {}).get("details", []):
+                if isinstance(detail, dict) and "retryDelay" in detail:
+                    retry_after = detail["retryDelay"]
+                    break
+        if retry_after is None:
+            return None
+        
+        try:
+            return float(str(retry_after).rstrip("s"))
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _parse_json_response(response_text: str, schema: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
+        """Parse a Gemini JSON reply (JSON mode guarantees bare JSON, no code fences)
+        
+        With a schema the reply is decoded and validated in one pass by pydantic-core;
+        a ValidationError propagates so callers fall back like any other failure.
+        """
+        
+        if schema is not None:
+            return schema.model_validate_json(response_text).model_dump()
+        
+        return orjson.loads(response_text)
+    
+    def _build_phase2_strategy_prompt(self, business_input: BusinessInput, analysis: Dict[str, Any]) -> str:
+        """Build Phase 2 advanced strategy generation prompt with multi-layer analysis"""
+        
+        market_analysis = analysis.get('market_intelligence', {})
+        differentiation = analysis.get('competitive_positioning', {}).get('differentiation_strategy', {})
+        personality_analysis = analysis.get('brand_personality', {})
+        visual_brief = analysis.get('visual_direction', {})
+        strategic_synthesis = analysis.get('strategic_recommendations', {})
+        
+        return PHASE2_STRATEGY_PROMPT_PREFIX + PHASE2_STRATEGY_CONTEXT_TEMPLATE.format_map({
+            **business_input.prompt_fields,
+            "market_position": market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard'),
+            "growth_opportunities": market_analysis.get('market_opportunities', {}).get('emerging_trends', []),
+            "differentiation_strategy": differentiation.get('positioning_against_competition', 'Standard'),
+            "unique_value_props": differentiation.get('unique_value_propositions', []),
+            "primary_archetype": personality_analysis.get('brand_archetype', {}).get('primary_archetype', 'Innovator'),
+            "core_traits": [trait.get('trait', '') for trait in personality_analysis.get('personality_traits', {}).get('core_traits', [])],
+            "visual_philosophy": visual_brief.get('visual_strategy', {}).get('visual_philosophy', 'Modern approach'),
+            "color_strategy": visual_brief.get('color_strategy', {}).get('color_psychology_rationale', 'Strategic colors'),
+            "key_insights": strategic_synthesis.get('strategic_insights', {}).get('key_insights', []),
+            "brand_promise": strategic_synthesis.get('brand_strategy_framework', {}).get('brand_promise', 'Excellence')
+        })
+    
+    async def _run_layer(self, layer_key: str, business_input: BusinessInput,
+                         layer_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run one analysis layer from the dispatch table, falling back to its generic analysis on error"""
+        
+        layer = ANALYSIS_LAYERS[layer_key]
+        prompt = layer.prompt_prefix + layer.context_template.format_map({
+            **business_input.prompt_fields,
+            **(layer_context or {})
+        })
+        
+        try:
+            try:
+                return await self._generate_json(prompt, layer.schema, layer.output_tokens)
+            except ValidationError as e:
+                # Malformed replies are not cached, so one fresh sample usually parses
+                logging.warning("⚠️ Invalid %s reply (%s validation errors), asking Gemini once more", layer.label, e.error_count())
+                return await self._generate_json(prompt, layer.schema, layer.output_tokens)
             
         except Exception as e:
-            logging.error(f"Error in strategic synthesis: {str(e)}")
-            return self._get_fallback_strategic_synthesis()
+            return self._layer_fallback(layer_key, e)
+    
+    @staticmethod
+    def _layer_fallback(layer_key: str, error: Exception) -> Dict[str, Any]:
+        """Log a failed analysis layer and return its generic fallback analysis"""
+        
+        layer = ANALYSIS_LAYERS[layer_key]
+        logging.error("Error in %s: %s", layer.label, error)
+        return orjson.loads(layer.fallback)
+    
+    async def analyze_market_position(self, business_input: BusinessInput) -> Dict[str, Any]:
+        """Layer 1: Advanced Market Analysis & Industry Intelligence"""
+        
+        return await self._run_layer("market_intelligence", business_input)
+    
+    async def analyze_competitive_landscape(self, business_input: BusinessInput, market_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Layer 2: Advanced Competitive Landscape & Differentiation Analysis"""
+        
+        # Market context is optional so this layer can run alongside Layer 1
+        market_context = ""
+        if market_analysis:
+            market_context = f"MARKET ANALYSIS: {market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning')}\n"
+        
+        return await self._run_layer("competitive_positioning", business_input, {"market_context": market_context})
+    
+    async def develop_brand_personality(self, business_input: BusinessInput, market_analysis: Dict, competitive_analysis: Dict) -> Dict[str, Any]:
+        """Layer 3: Advanced Brand Personality & Archetype Development"""
+        
+        return await self._run_layer("brand_personality", business_input, {
+            "market_position": market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning'),
+            "competitive_position": competitive_analysis.get('differentiation_strategy', {}).get('positioning_against_competition', 'Standard strategy')
+        })
+    
+    async def create_visual_brief(self, personality_analysis: Dict, market_analysis: Dict, business_input: BusinessInput) -> Dict[str, Any]:
+        """Layer 4: Advanced Visual Direction & Creative Brief Development"""
+        
+        return await self._run_layer("visual_direction", business_input, {
+            "primary_archetype": personality_analysis.get('brand_archetype', {}).get('primary_archetype', 'Innovator'),
+            "core_traits": [trait.get('trait', '') for trait in personality_analysis.get('personality_traits', {}).get('core_traits', [])],
+            "market_position": market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard positioning')
+        })
+
+    async def synthesize_strategy(self, market_analysis: Dict, competitive_analysis: Dict, 
+                                personality_analysis: Dict, visual_brief: Dict, business_input: BusinessInput) -> Dict[str, Any]:
+        """Layer 5: Advanced Strategic Synthesis & Comprehensive Recommendations"""
+        
+        return await self._run_layer("strategic_recommendations", business_input, {
+            "market_position": market_analysis.get('positioning_recommendations', {}).get('optimal_position', 'Standard'),
+            "competitive_position": competitive_analysis.get('differentiation_strategy', {}).get('positioning_against_competition', 'Standard'),
+            "primary_archetype": personality_analysis.get('brand_archetype', {}).get('primary_archetype', 'Innovator'),
+            "visual_philosophy": visual_brief.get('visual_strategy', {}).get('visual_philosophy', 'Modern approach')
+        })
 
     def calculate_analysis_confidence(self, market_analysis: Dict, competitive_analysis: Dict, 
                                     personality_analysis: Dict, visual_brief: Dict, strategic_synthesis: Dict) -> Dict[str, float]:
         """Calculate confidence scores for each analysis layer"""
         
-        return {
+        layer_scores = {
             "market_analysis_confidence": market_analysis.get("confidence_score", 0.85),
             "competitive_analysis_confidence": competitive_analysis.get("confidence_score", 0.80),
             "personality_analysis_confidence": personality_analysis.get("confidence_score", 0.90),
             "visual_brief_confidence": visual_brief.get("confidence_score", 0.88),
-            "strategic_synthesis_confidence": strategic_synthesis.get("confidence_score", 0.92),
-            "overall_confidence": (
-                market_analysis.get("confidence_score", 0.85) +
-                competitive_analysis.get("confidence_score", 0.80) +
-                personality_analysis.get("confidence_score", 0.90) +
-                visual_brief.get("confidence_score", 0.88) +
-                strategic_synthesis.get("confidence_score", 0.92)
-            ) / 5
+            "strategic_synthesis_confidence": strategic_synthesis.get("confidence_score", 0.92)
         }
+        layer_scores["overall_confidence"] = sum(layer_scores.values()) / len(layer_scores)
+        return layer_scores
     
     async def _generate_phase2_fallback_strategy(self, business_input: BusinessInput) -> BrandStrategy:
         """Generate Phase 2 enhanced fallback strategy with advanced capabilities"""
         
-        return BrandStrategy(
-            business_name=business_input.business_name,
-            brand_personality={
-                "primary_traits": ["innovative", "trustworthy", "professional", "forward-thinking", "reliable"],
-                "brand_archetype": "The Innovator",
-                "tone_of_voice": "Professional yet approachable, confident and knowledgeable",
-                "brand_essence": f"Pioneering excellence and innovation in {business_input.industry}",
-                "emotional_drivers": ["trust", "confidence", "aspiration"],
-                "personality_expression": "Consistent professional excellence across all touchpoints"
-            },
-            visual_direction={
-                "design_style": "Modern, clean, and sophisticated with strategic use of space",
-                "visual_mood": "Professional confidence with innovative edge",
-                "typography_strategy": "Clean, readable fonts that convey authority and accessibility",
-                "imagery_style": "High-quality, professional imagery that tells the brand story",
-                "logo_direction": "Simple, memorable, scalable design that works across all applications",
-                "layout_principles": "Clean hierarchy, strategic whitespace, consistent alignment",
-                "visual_consistency_framework": "Cohesive visual language across all brand touchpoints"
-            },
-            color_palette=["#2563eb", "#1e40af", "#3b82f6", "#60a5fa", "#f8fafc"],
-            messaging_framework={
-                "tagline": f"Innovating Excellence in {business_input.industry}",
-                "key_messages": ["Innovation Leadership", "Trusted Expertise", "Exceptional Results"],
-                "brand_promise": "Delivering innovative solutions that drive exceptional outcomes",
-                "unique_value_proposition": "Your strategic partner for breakthrough success",
-                "brand_story": f"Leading innovation in {business_input.industry} through expertise and commitment",
-                "messaging_hierarchy": "Innovation first, trust builds, results deliver"
-            },
-            consistency_rules={
-                "logo_usage": "Primary logo on light backgrounds, reversed logo on dark backgrounds",
-                "color_usage": "Primary blue for key elements, supporting palette for hierarchy",
-                "typography_rules": "Consistent font hierarchy with clear information architecture",
-                "visual_consistency": "Maintain sophisticated professional appearance across all materials",
-                "brand_voice_consistency": "Professional confidence balanced with approachable expertise",
-                "touchpoint_consistency": "Seamless brand experience across all customer interactions"
-            },
-            advanced_analysis={
-                "market_intelligence": {"confidence_score": 0.75},
-                "competitive_positioning": {"confidence_score": 0.70},
-                "brand_personality": {"confidence_score": 0.85},
-                "visual_direction": {"confidence_score": 0.80},
-                "strategic_recommendations": {"confidence_score": 0.78}
-            }
-        )
-
-    def _get_fallback_market_analysis(self) -> Dict[str, Any]:
-        """Fallback market analysis for error scenarios"""
-        return {
-            "market_size_analysis": {
-                "total_addressable_market": "Growing market with digital transformation opportunities",
-                "growth_trends": ["Digital adoption", "Customer experience focus", "Efficiency demands"],
-                "market_drivers": ["Technology advancement", "Changing customer expectations", "Competitive pressure"]
-            },
-            "industry_dynamics": {
-                "major_trends": ["Digital transformation", "Customer-centric approaches", "Innovation focus"],
-                "regulatory_environment": "Standard industry regulations apply",
-                "technology_disruptions": ["AI integration", "Automation", "Digital platforms"],
-                "industry_challenges": ["Market competition", "Technology adoption", "Customer retention"]
-            },
-            "target_audience_insights": {
-                "demographics": "Professional decision-makers and end users",
-                "psychographics": "Value-driven, efficiency-focused, quality-conscious",
-                "pain_points": ["Time constraints", "Quality concerns", "Cost considerations"],
-                "buying_behavior": "Research-driven decision making with emphasis on proven results",
-                "unmet_needs": ["Simplified solutions", "Better integration", "Improved outcomes"]
-            },
-            "market_opportunities": {
-                "underserved_segments": ["Small to medium businesses", "Emerging markets"],
-                "emerging_trends": ["Sustainability focus", "Remote solutions", "Personalization"],
-                "partnership_opportunities": ["Technology providers", "Industry associations"],
-                "market_gaps": ["Affordable premium solutions", "Integrated platforms"]
-            },
-            "positioning_recommendations": {
-                "optimal_position": "Innovative leader delivering exceptional value",
-                "value_proposition_focus": "Quality, innovation, and trusted expertise",
-                "differentiation_strategy": "Superior results through innovative approaches",
-                "positioning_statement": "The trusted partner for innovative excellence"
-            },
-            "confidence_score": 0.75
-        }
-
-    def _get_fallback_competitive_analysis(self) -> Dict[str, Any]:
-        """Fallback competitive analysis for error scenarios"""
-        return {
-            "competitive_landscape": {
-                "direct_competitors": [
-                    {"name": "Market Leader A", "market_share": "25%", "strengths": ["Brand recognition", "Market presence"]},
-                    {"name": "Challenger B", "market_share": "15%", "strengths": ["Innovation", "Customer service"]},
-                    {"name": "Specialist C", "market_share": "10%", "strengths": ["Expertise", "Specialization"]}
-                ],
-                "indirect_competitors": ["Alternative solutions", "In-house options", "Generic providers"],
-                "competitive_intensity": "Moderate to high with opportunities for differentiation"
-            },
-            "competitor_analysis": {
-                "market_leaders": ["Established Player 1", "Established Player 2"],
-                "brand_strength_ranking": ["Leader A", "Challenger B", "Specialist C"],
-                "competitive_advantages_by_player": {
-                    "Leader A": ["Market presence", "Resources"],
-                    "Challenger B": ["Innovation", "Agility"]
-                }
-            },
-            "market_gaps": {
-                "unmet_customer_needs": ["Better integration", "Simplified solutions", "Personal touch"],
-                "service_gaps": ["Customization", "Support quality", "Value pricing"],
-                "positioning_white_spaces": ["Premium affordable", "Innovative traditional"],
-                "underserved_segments": ["Small business", "Emerging sectors"]
-            },
-            "differentiation_strategy": {
-                "unique_value_propositions": ["Superior outcomes", "Innovative approach", "Trusted partnership"],
-                "competitive_moats": ["Expertise depth", "Customer relationships", "Innovation capability"],
-                "positioning_against_competition": "Premium quality with accessible approach",
-                "differentiation_pillars": ["Innovation", "Quality", "Service", "Results"]
-            },
-            "strategic_recommendations": {
-                "competitive_response_strategies": ["Focus on differentiation", "Build customer loyalty"],
-                "market_entry_tactics": ["Value demonstration", "Strategic partnerships"],
-                "brand_positioning_strategy": "Position as innovative leader with proven results",
-                "competitive_messaging": "Emphasize unique value and proven outcomes"
-            },
-            "confidence_score": 0.70
-        }
-
-    def _get_fallback_personality_analysis(self) -> Dict[str, Any]:
-        """Fallback personality analysis for error scenarios"""
-        return {
-            "brand_archetype": {
-                "primary_archetype": "The Innovator",
-                "secondary_influences": ["The Expert", "The Caregiver"],
-                "archetype_justification": "Fits market need for innovative solutions with trusted expertise",
-                "archetype_characteristics": ["Forward-thinking", "Problem-solving", "Reliable", "Creative"]
-            },
-            "personality_traits": {
-                "core_traits": [
-                    {"trait": "Innovative", "description": "Forward-thinking and creative", "expression": "Shows up in solutions and approaches"},
-                    {"trait": "Trustworthy", "description": "Reliable and dependable", "expression": "Consistent delivery and communication"},
-                    {"trait": "Professional", "description": "Expert and competent", "expression": "Quality work and professional standards"},
-                    {"trait": "Approachable", "description": "Accessible and friendly", "expression": "Easy to work with and understand"},
-                    {"trait": "Results-focused", "description": "Outcome-oriented", "expression": "Clear delivery and measurable success"}
-                ],
-                "personality_summary": "An innovative yet trustworthy brand that combines expertise with approachability"
-            },
-            "brand_voice": {
-                "communication_style": "Professional confidence balanced with approachable expertise",
-                "tone_variations": {
-                    "formal_contexts": "Professional and authoritative",
-                    "casual_contexts": "Friendly and helpful",
-                    "crisis_contexts": "Calm and reassuring"
-                },
-                "language_patterns": ["Clear communication", "Action-oriented", "Solution-focused"],
-                "vocabulary_preferences": ["Positive", "Professional", "Accessible"]
-            },
-            "brand_values_beliefs": {
-                "core_values": ["Innovation", "Quality", "Trust", "Excellence", "Partnership"],
-                "brand_purpose": "To drive success through innovative excellence",
-                "mission_statement": "Delivering exceptional outcomes through innovative solutions",
-                "belief_system": ["Quality matters", "Innovation drives progress", "Trust builds relationships"],
-                "worldview": "Success comes from combining innovation with proven expertise"
-            },
-            "relationship_dynamics": {
-                "customer_relationship_model": "Trusted advisor and strategic partner",
-                "trust_building_approach": "Consistent delivery and transparent communication",
-                "credibility_factors": ["Proven results", "Expert knowledge", "Professional approach"],
-                "relationship_goals": ["Long-term partnership", "Mutual success"]
-            },
-            "emotional_positioning": {
-                "primary_emotions": ["Confidence", "Trust", "Aspiration"],
-                "emotional_journey": {
-                    "awareness": "Curiosity and interest",
-                    "consideration": "Confidence and trust",
-                    "purchase": "Excitement and commitment",
-                    "loyalty": "Satisfaction and advocacy"
-                },
-                "feeling_differentiation": "Trusted innovation partner vs. just another service provider"
-            },
-            "confidence_score": 0.85
-        }
-
-    def _get_fallback_visual_brief(self) -> Dict[str, Any]:
-        """Fallback visual brief for error scenarios"""
-        return {
-            "visual_strategy": {
-                "visual_philosophy": "Clean, professional design that conveys innovation and trust",
-                "visual_personality_expression": "Modern sophistication with approachable professionalism",
-                "visual_goals": ["Build trust", "Convey expertise", "Show innovation"],
-                "brand_visual_positioning": "Premium quality with accessible approach"
-            },
-            "design_system": {
-                "primary_design_principles": ["Clarity", "Consistency", "Quality"],
-                "visual_hierarchy": "Clear information architecture with strategic emphasis",
-                "design_components": ["Typography", "Color", "Imagery", "Layout"],
-                "consistency_framework": "Unified visual language across all touchpoints"
-            },
-            "color_strategy": {
-                "strategic_palette": [
-                    {"color": "Primary Blue", "hex": "#2563eb", "psychology": "Trust and professionalism", "usage": "Main brand elements"},
-                    {"color": "Secondary Blue", "hex": "#1e40af", "psychology": "Depth and reliability", "usage": "Supporting elements"},
-                    {"color": "Accent Blue", "hex": "#3b82f6", "psychology": "Innovation and energy", "usage": "Highlights and calls to action"},
-                    {"color": "Light Blue", "hex": "#60a5fa", "psychology": "Accessibility and friendliness", "usage": "Secondary accents"},
-                    {"color": "Neutral", "hex": "#f8fafc", "psychology": "Clean and professional", "usage": "Backgrounds and text"}
-                ],
-                "color_psychology_rationale": "Blue conveys trust and professionalism while maintaining innovation feel",
-                "color_combinations": "Primary with neutrals for authority, accents for energy"
-            },
-            "typography_strategy": {
-                "typography_personality": "Clean, readable, and professional with modern feel",
-                "font_selection_criteria": "Legibility, professionalism, modern appearance",
-                "typographic_hierarchy": {
-                    "primary_heading": "Bold, clear, authoritative",
-                    "secondary_heading": "Supporting, professional",
-                    "body_text": "Clean, readable, accessible",
-                    "accent_text": "Strategic emphasis elements"
-                },
-                "typography_applications": "Consistent hierarchy across all brand materials"
-            },
-            "imagery_direction": {
-                "photography_style": "Professional, high-quality, authentic",
-                "illustration_style": "Clean, modern, purposeful when needed",
-                "visual_content_strategy": "Support brand story with quality visuals",
-                "mood_aesthetic": "Professional confidence with approachable warmth",
-                "visual_storytelling": "Show expertise and results through visual narrative"
-            },
-            "logo_identity_brief": {
-                "logo_design_direction": "Simple, memorable, scalable design",
-                "identity_system_requirements": "Flexible system for all applications",
-                "logo_personality_expression": "Innovation balanced with trustworthiness",
-                "application_considerations": "Digital and print, various sizes and contexts",
-                "logo_effectiveness_criteria": "Recognition, memorability, appropriate personality"
-            },
-            "confidence_score": 0.80
-        }
-
-    def _get_fallback_strategic_synthesis(self) -> Dict[str, Any]:
-        """Fallback strategic synthesis for error scenarios"""
-        return {
-            "strategic_insights": {
-                "key_insights": ["Market opportunity exists", "Differentiation is key", "Trust builds success", "Innovation drives growth"],
-                "strategic_themes": ["Innovation leadership", "Trusted expertise", "Quality delivery"],
-                "critical_success_factors": ["Brand differentiation", "Customer trust", "Quality delivery"],
-                "strategic_opportunities": ["Market leadership", "Customer loyalty"]
-            },
-            "brand_strategy_framework": {
-                "unified_strategy": "Innovative leader delivering exceptional results through trusted expertise",
-                "positioning_statement": "The trusted partner for innovative excellence and exceptional outcomes",
-                "strategy_pillars": ["Innovation", "Trust", "Quality", "Results"],
-                "brand_promise": "Exceptional outcomes through innovative excellence",
-                "unique_value_proposition": "Proven results through innovative approaches and trusted expertise"
-            },
-            "implementation_roadmap": {
-                "phase_1_immediate": {
-                    "timeline": "0-3 months",
-                    "priorities": ["Brand foundation", "Visual identity", "Key messaging"],
-                    "deliverables": ["Brand guidelines", "Visual assets"]
-                },
-                "phase_2_build": {
-                    "timeline": "3-9 months",
-                    "priorities": ["Market presence", "Customer experience", "Brand consistency"],
-                    "deliverables": ["Marketing materials", "Customer touchpoints"]
-                },
-                "phase_3_optimize": {
-                    "timeline": "9-18 months",
-                    "priorities": ["Brand optimization", "Market expansion"],
-                    "deliverables": ["Performance analytics", "Brand evolution"]
-                }
-            },
-            "success_measurement": {
-                "kpis": ["Brand awareness", "Customer satisfaction", "Market share", "Brand perception"],
-                "success_metrics": {
-                    "brand_awareness": "Measure recognition and recall",
-                    "brand_perception": "Track brand attributes and sentiment",
-                    "business_impact": "Monitor business growth and customer metrics"
-                },
-                "measurement_frequency": "Quarterly assessment with annual comprehensive review"
-            },
-            "strategic_recommendations": {
-                "immediate_actions": ["Establish brand foundation", "Create consistent messaging", "Develop visual identity"],
-                "long_term_initiatives": ["Build market leadership", "Expand customer base"],
-                "risk_mitigation": ["Monitor competitive response", "Maintain quality standards"],
-                "competitive_response": "Focus on differentiation and customer value"
-            },
-            "confidence_score": 0.78
-        }
\ No newline at end of file
+        # Only the industry-specific copy is built per call
+        fallback = orjson.loads(FALLBACK_PHASE2_STRATEGY)
+        industry = business_input.industry
+        fallback["brand_personality"]["brand_essence"] = f"Pioneering excellence and innovation in {industry}"
+        fallback["messaging_framework"]["tagline"] = f"Innovating Excellence in {industry}"
+        fallback["messaging_framework"]["brand_story"] = f"Leading innovation in {industry} through expertise and commitment"
+        
+        return BrandStrategy(business_name=business_input.business_name, **fallback)
@@ -1,9 +1,10 @@
 import os
-import json
+import orjson
 import logging
 import zipfile
 import io
 import base64
+from collections.abc import Mapping
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from reportlab.lib.pagesizes import letter, A4
@@ -17,6 +18,24 @@ from models.brand_strategy import BrandStrategy
 from models.visual_assets import GeneratedAsset
 from models.project_state import BrandProject
 
+# Package JSON carries raw asset metadata, which may hold numpy scalars, non-string keys
+# or read-only mappings; none of these should fail the whole ZIP
+PACKAGE_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _package_json_default(obj: Any) -> Any:
+    """orjson fallback for values it cannot serialize natively"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def _dump_package_json(data: Any) -> bytes:
+    """Serialize package JSON files, tolerating whatever asset metadata contains"""
+    return orjson.dumps(data, default=_package_json_default, option=PACKAGE_JSON_OPTIONS)
+
 class ProfessionalExportEngine:
     """Enterprise-grade asset packaging and export system"""
     
@@ -451,24 +470,26 @@ class ProfessionalExportEngine:
         try:
             zip_buffer = io.BytesIO()
             
+            # PNGs and the PDF are already compressed, so they are stored as-is;
+            # only the JSON files are deflated
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 # Add brand guidelines PDF
                 if package_contents.get('brand_guidelines'):
                     pdf_data = base64.b64decode(package_contents['brand_guidelines'])
-                    zip_file.writestr(f"{business_name}_Brand_Guidelines.pdf", pdf_data)
+                    zip_file.writestr(f"{business_name}_Brand_Guidelines.pdf", pdf_data, compress_type=zipfile.ZIP_STORED)
                 
                 # Add logo suite
                 logo_suite = package_contents.get('logo_suite', {})
                 if logo_suite.get('primary_logo'):
                     logo_data = self._extract_base64_data(logo_suite['primary_logo']['url'])
                     if logo_data:
-                        zip_file.writestr(f"logos/{business_name}_Primary_Logo.png", logo_data)
+                        zip_file.writestr(f"logos/{business_name}_Primary_Logo.png", logo_data, compress_type=zipfile.ZIP_STORED)
                 
                 for i, variation in enumerate(logo_suite.get('variations', [])):
                     logo_data = self._extract_base64_data(variation['url'])
                     if logo_data:
                         variant_name = variation['type'].replace('logo_', '').title()
-                        zip_file.writestr(f"logos/{business_name}_{variant_name}_Logo.png", logo_data)
+                        zip_file.writestr(f"logos/{business_name}_{variant_name}_Logo.png", logo_data, compress_type=zipfile.ZIP_STORED)
                 
                 # Add marketing assets
                 marketing_assets = package_contents.get('marketing_assets', {})
@@ -478,28 +499,30 @@ class ProfessionalExportEngine:
                             asset_data = self._extract_base64_data(asset['url'])
                             if asset_data:
                                 asset_name = asset['type'].replace('_', ' ').title()
-                                zip_file.writestr(f"marketing_assets/{asset_name}.png", asset_data)
+                                zip_file.writestr(f"marketing_assets/{asset_name}.png", asset_data, compress_type=zipfile.ZIP_STORED)
                 
                 # Add color palette information
                 color_palette = package_contents.get('color_palette', {})
                 if color_palette:
-                    color_json = json.dumps(color_palette, indent=2)
+                    color_json = _dump_package_json(color_palette)
                     zip_file.writestr(f"colors/{business_name}_Color_Palette.json", color_json)
                 
                 # Add asset inventory
                 inventory = package_contents.get('asset_inventory', {})
                 if inventory:
-                    inventory_json = json.dumps(inventory, indent=2)
+                    inventory_json = _dump_package_json(inventory)
                     zip_file.writestr(f"{business_name}_Asset_Inventory.json", inventory_json)
                 
                 # Add usage examples
                 usage_examples = package_contents.get('usage_examples', {})
                 if usage_examples:
-                    usage_json = json.dumps(usage_examples, indent=2)
+                    usage_json = _dump_package_json(usage_examples)
                     zip_file.writestr(f"{business_name}_Usage_Guide.json", usage_json)
             
-            zip_buffer.seek(0)
-            zip_data = base64.b64encode(zip_buffer.getvalue()).decode('utf-8')
+            # Encode straight from the buffer's memory instead of a getvalue() copy;
+            # the view is released before close()
+            with zip_buffer.getbuffer() as zip_view:
+                zip_data = base64.b64encode(zip_view).decode('ascii')
             zip_buffer.close()
             
             return zip_data
@@ -568,7 +591,7 @@ class ProfessionalExportEngine:
                 'g': int(hex_color[2:4], 16),
                 'b': int(hex_color[4:6], 16)
             }
-        except:
+        except (ValueError, AttributeError):
             return {'r': 0, 'g': 0, 'b': 0}
     
     def _get_color_usage(self, color_name: str) -> str:
@@ -0,0 +1,39 @@
+import os
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google import genai
+
+@lru_cache(maxsize=None)
+def get_gemini_client() -> "genai.Client":
+    """Return the process-wide Gemini client so every engine shares one HTTP connection pool
+
+    google.genai is imported here rather than at module load: it pulls in a large
+    dependency tree, and nothing needs it until the first Gemini call. The async
+    client speaks HTTP/2, so concurrent layer and image calls multiplex over one
+    TLS connection instead of opening one each.
+    """
+    from google import genai
+    from google.genai import types
+
+    return genai.Client(
+        api_key=os.environ.get('GEMINI_API_KEY'),
+        http_options=types.HttpOptions(async_client_args={"http2": True})
+    )
+
+async def close_gemini_client() -> None:
+    """Close the shared Gemini client's connections, if it was ever created"""
+
+    if get_gemini_client.cache_info().currsize == 0:
+        return
+
+    gemini_client = get_gemini_client()
+    try:
+        await gemini_client.aio.aclose()
+        gemini_client.close()
+    except Exception as e:
+        logging.error(f"Error closing Gemini client: {str(e)}")
+    finally:
+        get_gemini_client.cache_clear()
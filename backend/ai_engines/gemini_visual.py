@@ -1,22 +1,33 @@
 import os
-import json
 import logging
 import asyncio
 import base64
 import io
 import hashlib
 import time
+import random
+import weakref
 from typing import Dict, Any, List, Optional, Tuple
-from google import genai
 from PIL import Image
+from ai_engines.gemini_client import get_gemini_client
 from models.brand_strategy import BrandStrategy
 from models.visual_assets import GeneratedAsset, AssetGenerationRequest, AssetVariation
 
+# Image generations allowed in flight at once across all visual engines, so
+# logo suites and batch requests queue instead of tripping Gemini rate limits
+IMAGE_MAX_CONCURRENCY = int(os.getenv("IMAGE_MAX_CONCURRENCY", "4"))
+
+# Base delay (seconds) for jittered exponential backoff between generation attempts
+IMAGE_RETRY_BASE_DELAY = 1.0
+
 class GeminiVisualEngine:
     """🚀 PHASE 3: Revolutionary visual asset generation using Gemini with advanced consistency management"""
     
+    # One limiter per event loop, created on first use: an asyncio.Semaphore binds to the
+    # loop that first waits on it, so a single class-level instance breaks under a second loop
+    _generation_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+    
     def __init__(self):
-        self.client = genai.Client(api_key=os.environ.get('GEMINI_API_KEY'))
         self.consistency_seed = None
         self.brand_dna = None
         self.generation_history = []
@@ -52,6 +63,20 @@ class GeminiVisualEngine:
             'brand_pattern', 'icon_suite', 'mockup_business_cards', 'mockup_letterhead'
         ]
         
+    @property
+    def client(self):
+        """Shared Gemini client, so per-request engines reuse one connection pool"""
+        return get_gemini_client()
+    
+    @classmethod
+    def _generation_semaphore(cls) -> asyncio.Semaphore:
+        """Image generation limiter for the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = cls._generation_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._generation_semaphores[loop] = asyncio.Semaphore(IMAGE_MAX_CONCURRENCY)
+        return semaphore
+    
     def set_brand_consistency(self, brand_strategy: BrandStrategy, seed: Optional[str] = None):
         """🧬 PHASE 3: Set advanced consistency parameters with visual DNA extraction"""
         self.consistency_seed = seed or self._generate_brand_seed(brand_strategy)
@@ -150,13 +175,12 @@ class GeminiVisualEngine:
         # 🔄 ADVANCED RETRY LOGIC with consistency validation
         for attempt in range(tier_config["max_retries"]):
             try:
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(None, 
-                    lambda: self.client.models.generate_content(
+                # Native async client: no executor thread is held for the whole generation
+                async with self._generation_semaphore():
+                    response = await self.client.aio.models.generate_content(
                         model=tier_config["model"],
                         contents=prompt
                     )
-                )
                 
                 image_data = self._extract_image_data(response)
                 
@@ -189,6 +213,8 @@ class GeminiVisualEngine:
                 logging.warning(f"Generation attempt {attempt + 1} failed for {asset_type}: {str(e)}")
                 if attempt == tier_config["max_retries"] - 1:
                     return self._create_enhanced_placeholder_asset(project_id, asset_type, str(e))
+                # Back off so a rate-limited retry does not fail again immediately
+                await asyncio.sleep(IMAGE_RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.5))
         
         return self._create_enhanced_placeholder_asset(project_id, asset_type, "Max retries exceeded")
     
@@ -1056,7 +1082,7 @@ class GeminiVisualEngine:
                                 # If it's something else, try to convert
                                 try:
                                     return base64.b64encode(raw_data).decode('utf-8')
-                                except:
+                                except TypeError:
                                     # Try converting to string first
                                     return str(raw_data)
             return None
@@ -1,7 +1,9 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping
 from datetime import datetime, timezone
 import uuid
+from functools import cached_property
+from types import MappingProxyType
 
 class BusinessInput(BaseModel):
     business_name: str
@@ -12,6 +14,24 @@ class BusinessInput(BaseModel):
     preferred_style: Optional[str] = "modern"
     preferred_colors: Optional[str] = "flexible"
 
+    @cached_property
+    def business_values_text(self) -> str:
+        # Comma-joined values, built once per input and reused by every strategy prompt
+        return ', '.join(self.business_values)
+
+    @cached_property
+    def prompt_fields(self) -> Mapping[str, Any]:
+        # Fields substituted into every strategy prompt template, built once per input
+        return MappingProxyType({
+            "business_name": self.business_name,
+            "business_description": self.business_description,
+            "industry": self.industry,
+            "target_audience": self.target_audience,
+            "business_values": self.business_values_text,
+            "preferred_style": self.preferred_style,
+            "preferred_colors": self.preferred_colors
+        })
+
 class BrandStrategy(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     business_name: str
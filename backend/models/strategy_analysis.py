@@ -0,0 +1,108 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, List
+
+# Response schemas for the five strategy analysis layers. Sections are required
+# objects; their contents stay free-form and unknown keys are kept as-is.
+
+class MarketAnalysis(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    market_size_analysis: Dict[str, Any]
+    industry_dynamics: Dict[str, Any]
+    target_audience_insights: Dict[str, Any]
+    market_opportunities: Dict[str, Any]
+    positioning_recommendations: Dict[str, Any]
+    confidence_score: float = 0.85
+
+class CompetitiveAnalysis(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    competitive_landscape: Dict[str, Any]
+    competitor_analysis: Dict[str, Any]
+    market_gaps: Dict[str, Any]
+    differentiation_strategy: Dict[str, Any]
+    strategic_recommendations: Dict[str, Any]
+    confidence_score: float = 0.80
+
+class PersonalityAnalysis(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    brand_archetype: Dict[str, Any]
+    personality_traits: Dict[str, Any]
+    brand_voice: Dict[str, Any]
+    brand_values_beliefs: Dict[str, Any]
+    relationship_dynamics: Dict[str, Any]
+    emotional_positioning: Dict[str, Any]
+    confidence_score: float = 0.90
+
+class VisualBrief(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    visual_strategy: Dict[str, Any]
+    design_system: Dict[str, Any]
+    color_strategy: Dict[str, Any]
+    typography_strategy: Dict[str, Any]
+    imagery_direction: Dict[str, Any]
+    logo_identity_brief: Dict[str, Any]
+    confidence_score: float = 0.88
+
+class StrategicSynthesis(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    strategic_insights: Dict[str, Any]
+    brand_strategy_framework: Dict[str, Any]
+    implementation_roadmap: Dict[str, Any]
+    success_measurement: Dict[str, Any]
+    strategic_recommendations: Dict[str, Any]
+    confidence_score: float = 0.92
+
+# Response schema for the final Phase 2 strategy reply. It is sent to Gemini as the
+# structured-output schema, so field descriptions stand in for the prompt's JSON example.
+
+class StrategyBrandPersonality(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    primary_traits: List[str] = Field(description="Five primary brand traits")
+    brand_archetype: str = Field(description="Archetype name from the analysis")
+    tone_of_voice: str = Field(description="Sophisticated tone description based on the analysis")
+    brand_essence: str = Field(description="Powerful one-sentence brand essence")
+    emotional_drivers: List[str] = Field(description="Three emotional drivers")
+    personality_expression: str = Field(description="How the personality shows up across touchpoints")
+
+class StrategyVisualDirection(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    design_style: str = Field(description="Advanced style description from the visual brief")
+    visual_mood: str = Field(description="Sophisticated mood from the analysis")
+    typography_strategy: str = Field(description="Strategic typography recommendations")
+    imagery_style: str = Field(description="Advanced imagery direction")
+    logo_direction: str = Field(description="Detailed logo design guidance from the brief")
+    layout_principles: str = Field(description="Advanced layout composition guidelines")
+    visual_consistency_framework: str = Field(description="Comprehensive visual consistency approach")
+
+class StrategyMessagingFramework(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    tagline: str = Field(description="Compelling, memorable tagline from the synthesis")
+    key_messages: List[str] = Field(description="Three strategic key messages")
+    brand_promise: str = Field(description="Clear brand promise from the analysis")
+    unique_value_proposition: str = Field(description="Distinctive UVP from the competitive analysis")
+    brand_story: str = Field(description="Compelling brand narrative drawing on all layers")
+    messaging_hierarchy: str = Field(description="How messages prioritize and connect")
+
+class StrategyConsistencyRules(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    logo_usage: str = Field(description="Detailed logo usage guidelines from the visual brief")
+    color_usage: str = Field(description="Strategic color application rules")
+    typography_rules: str = Field(description="Comprehensive typography hierarchy")
+    visual_consistency: str = Field(description="Advanced visual consistency requirements")
+    brand_voice_consistency: str = Field(description="Voice and tone consistency rules")
+    touchpoint_consistency: str = Field(description="How the brand stays consistent across all touchpoints")
+
+class StrategyDraft(BaseModel):
+    brand_personality: StrategyBrandPersonality
+    visual_direction: StrategyVisualDirection
+    color_palette: List[str] = Field(description="Five hex colors: primary, secondary, accent 1, accent 2, neutral")
+    messaging_framework: StrategyMessagingFramework
+    consistency_rules: StrategyConsistencyRules
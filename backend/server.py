@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -11,12 +11,10 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timezone
-from google import genai
 import base64
 import io
 from PIL import Image
 import aiofiles
-import json
 import asyncio
 
 # Import the new advanced models and engines
@@ -27,21 +25,25 @@ from ai_engines.emergent_strategy import AdvancedBrandStrategyEngine
 from ai_engines.gemini_visual import GeminiVisualEngine
 from ai_engines.consistency_manager import ConsistencyManager
 from ai_engines.export_engine import ProfessionalExportEngine
+from ai_engines.gemini_client import close_gemini_client
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# Initialize Gemini client
-gemini_client = genai.Client(api_key=os.environ['GEMINI_API_KEY'])
-
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 projects_collection = db.brand_projects
 
-# Create the main app without a prefix
-app = FastAPI(title="BrandForge AI", version="1.0.0")
+# Start the strategic analysis when a project is created, so the follow-up strategy
+# request finds it ready. Off by default: every POST /projects then costs five Gemini
+# calls even when the client never asks for a strategy.
+ANALYSIS_PREFETCH_ENABLED = os.environ.get('ANALYSIS_PREFETCH', 'false').lower() == 'true'
+
+# Create the main app without a prefix. Responses are encoded with orjson, since
+# strategy and analysis payloads are large nested dicts.
+app = FastAPI(title="BrandForge AI", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -86,6 +88,10 @@ async def create_project(business_input: BusinessInput):
         # Store in database
         await db.brand_projects.insert_one(project_dict)
         
+        # Start the strategic analysis now so the follow-up strategy request finds it ready
+        if ANALYSIS_PREFETCH_ENABLED:
+            brand_strategy_engine.prefetch_analysis(business_input)
+        
         return {
             "project_id": project.id,
             "status": project.status,
@@ -131,17 +137,19 @@ async def generate_brand_strategy(project_id: str, advanced_analysis: bool = Tru
         strategy_dict = brand_strategy.dict()
         strategy_dict['created_at'] = strategy_dict['created_at'].isoformat()
         
-        await db.brand_strategies.insert_one(strategy_dict)
-        
         # Update project in database
         project_dict = project.dict()
         project_dict['created_at'] = project_dict['created_at'].isoformat()
         project_dict['updated_at'] = project_dict['updated_at'].isoformat()
         project_dict['brand_strategy']['created_at'] = project_dict['brand_strategy']['created_at'].isoformat()
         
-        await db.brand_projects.update_one(
-            {"id": project_id},
-            {"$set": project_dict}
+        # The two writes are independent, so they share one round-trip wait
+        await asyncio.gather(
+            db.brand_strategies.insert_one(strategy_dict),
+            db.brand_projects.update_one(
+                {"id": project_id},
+                {"$set": project_dict}
+            )
         )
         
         return brand_strategy
@@ -586,8 +594,9 @@ async def get_project_analytics(project_id: str):
         if not project.brand_strategy:
             return {"message": "Analytics available after brand strategy generation"}
         
-        # Generate consistency analysis
-        consistency_guidelines = consistency_manager.generate_brand_guidelines_document(
+        # Generate consistency analysis (off the event loop, like the other consistency calls)
+        consistency_guidelines = await asyncio.to_thread(
+            consistency_manager.generate_brand_guidelines_document,
             project.brand_strategy, project.generated_assets
         )
         
@@ -656,8 +665,10 @@ async def advanced_consistency_validation(
         # Get other assets for comparison (excluding the target asset)
         base_assets = [asset for asset in project.generated_assets if asset.id != asset_id]
         
-        # Perform advanced consistency validation and refinement
-        validation_result = consistency_manager.validate_and_refine_asset(
+        # Perform advanced consistency validation and refinement. The consistency
+        # engines make blocking Gemini calls, so they run in a worker thread.
+        validation_result = await asyncio.to_thread(
+            consistency_manager.validate_and_refine_asset,
             generated_asset=target_asset,
             base_assets=base_assets,
             brand_strategy=project.brand_strategy,
@@ -712,7 +723,7 @@ async def extract_visual_dna(project_id: str):
             raise HTTPException(status_code=400, detail="No assets available for visual DNA extraction")
         
         # Extract comprehensive visual DNA
-        visual_dna = consistency_manager.extract_comprehensive_visual_dna(project.generated_assets)
+        visual_dna = await asyncio.to_thread(consistency_manager.extract_comprehensive_visual_dna, project.generated_assets)
         
         return {
             "project_id": project_id,
@@ -766,7 +777,8 @@ async def generate_intelligent_constraints(
             raise HTTPException(status_code=400, detail="Brand strategy required for constraint generation")
         
         # Generate intelligent consistency constraints
-        constraints_result = consistency_manager.maintain_visual_consistency(
+        constraints_result = await asyncio.to_thread(
+            consistency_manager.maintain_visual_consistency,
             base_assets=project.generated_assets,
             new_asset_type=asset_type,
             brand_strategy=project.brand_strategy
@@ -865,17 +877,19 @@ async def intelligent_asset_refinement(
         base_assets = [asset for asset in project.generated_assets if asset.id != asset_id]
         
         # Extract visual DNA from base assets
-        visual_dna = consistency_manager.extract_comprehensive_visual_dna(base_assets)
+        visual_dna = await asyncio.to_thread(consistency_manager.extract_comprehensive_visual_dna, base_assets)
         
-        # Perform initial consistency analysis
-        consistency_analysis = consistency_manager.validate_comprehensive_consistency(
+        # Perform initial consistency analysis; it decodes every asset image, so it runs in a worker thread
+        consistency_analysis = await asyncio.to_thread(
+            consistency_manager.validate_comprehensive_consistency,
             new_asset=target_asset,
             base_assets=base_assets,
             brand_strategy=project.brand_strategy
         )
         
         # Execute intelligent refinement
-        refinement_result = consistency_manager.execute_intelligent_refinement(
+        refinement_result = await asyncio.to_thread(
+            consistency_manager.execute_intelligent_refinement,
             asset=target_asset,
             consistency_analysis=consistency_analysis,
             visual_dna=visual_dna,
@@ -941,4 +955,5 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    client.close()
+    await close_gemini_client()
\ No newline at end of file
@@ -0,0 +1,134 @@
+"""Image-based consistency scoring in the legacy consistency manager, on small synthetic PNGs"""
+
+import base64
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'backend'))
+
+from ai_engines.consistency_manager import AdvancedConsistencyManager  # noqa: E402
+from models.brand_strategy import BrandStrategy  # noqa: E402
+from models.visual_assets import GeneratedAsset  # noqa: E402
+
+BLUE = (20, 60, 200)
+RED = (220, 30, 30)
+WHITE = (255, 255, 255)
+BLACK = (10, 10, 10)
+
+
+def make_asset(background, foreground, coverage=0.1, asset_id=None, size=64):
+    """PNG asset with a foreground band covering part of a plain background"""
+    image = Image.new('RGB', (size, size), background)
+    image.paste(Image.new('RGB', (size, max(1, int(size * coverage))), foreground), (0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG')
+    fields = {'id': asset_id} if asset_id else {}
+    return GeneratedAsset(
+        project_id='project', asset_type='logo', metadata={'generation_method': 'gemini'},
+        asset_url='data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode(), **fields
+    )
+
+
+def make_strategy(color_palette):
+    return BrandStrategy(
+        business_name='Acme', brand_personality={'primary_traits': ['bold', 'modern']},
+        visual_direction={'design_style': 'minimal'}, color_palette=color_palette,
+        messaging_framework={}, consistency_rules={}
+    )
+
+
+@pytest.fixture
+def manager():
+    return AdvancedConsistencyManager()
+
+
+def color_score(manager, asset, existing, palette):
+    return manager._score_consistency_batch([asset], existing, palette)[0, 0]
+
+
+def test_on_palette_asset_scores_above_off_palette_asset(manager):
+    palette = ['#143CC8']
+    on_palette = color_score(manager, make_asset(WHITE, BLUE, 0.5), [], palette)
+    off_palette = color_score(manager, make_asset(WHITE, RED, 0.5), [], palette)
+
+    assert on_palette > 0.95
+    assert off_palette < 0.5
+
+
+def test_white_background_does_not_count_as_red(manager):
+    # A small blue mark on a mostly white canvas against a blue palette with neutrals
+    palette = ['#143CC8', '#FFFFFF', '#222222']
+    logo = make_asset(WHITE, BLUE, 0.1)
+
+    assert color_score(manager, logo, [], palette) > 0.95
+    score, result = manager.validate_asset_consistency(logo, [], make_strategy(palette))
+    assert result['passes_threshold']
+
+
+def test_hue_distance_wraps_around_the_hue_circle(manager):
+    # Hues just below 360° and just above 0° are neighbours
+    near_360 = make_asset(WHITE, (255, 0, 12), 0.5)
+
+    assert color_score(manager, near_360, [], ['#FF0C00']) > 0.85
+
+
+def test_achromatic_asset_keeps_metadata_color_score(manager):
+    grey_logo = make_asset(WHITE, (90, 90, 90), 0.5)
+    grey_logo.metadata['brand_alignment_score'] = 0.77
+
+    assert color_score(manager, grey_logo, [], ['#143CC8']) == pytest.approx(0.77)
+
+
+def test_peer_comparison_ignores_backgrounds(manager):
+    palette = ['#143CC8']
+    on_white = make_asset(WHITE, BLUE, 0.2)
+    same_color_on_black = make_asset(BLACK, BLUE, 0.5)
+    other_color_on_white = make_asset(WHITE, RED, 0.2)
+
+    consistent = color_score(manager, on_white, [same_color_on_black], palette)
+    inconsistent = color_score(manager, on_white, [other_color_on_white], palette)
+
+    assert consistent > 0.95
+    assert inconsistent < consistent - 0.3
+
+
+def test_undecodable_image_is_cached_as_failure(manager, monkeypatch):
+    broken = GeneratedAsset(project_id='project', asset_type='logo', asset_url='data:image/png;base64,AAAA', metadata={})
+    calls = []
+    compute = AdvancedConsistencyManager._compute_hsv_signature
+    monkeypatch.setattr(AdvancedConsistencyManager, '_compute_hsv_signature',
+                        staticmethod(lambda asset: calls.append(asset.id) or compute(asset)))
+
+    assert manager._hsv_signature(broken) is None
+    assert manager._hsv_signature(broken) is None
+    assert calls == [broken.id]
+    assert broken.metadata == {}
+
+
+def test_refined_image_under_same_id_is_reanalyzed(manager):
+    blue = make_asset(WHITE, BLUE, 0.5, asset_id='asset-1')
+    red = make_asset(WHITE, RED, 0.5, asset_id='asset-1')
+
+    assert not np.array_equal(manager._hsv_signature(blue), manager._hsv_signature(red))
+
+
+def test_strategy_edited_in_place_is_reflected(manager):
+    strategy = make_strategy(['#143CC8'])
+    first = manager.initialize_brand_consistency(strategy)
+
+    strategy.color_palette.append('#C81E1E')
+    strategy.visual_direction['design_style'] = 'playful'
+    second = manager.initialize_brand_consistency(strategy)
+
+    assert second['brand_guidelines']['color_palette'] == ['#143CC8', '#C81E1E']
+    assert second['brand_guidelines']['design_style'] == 'playful'
+    assert second['consistency_rules'] != first['consistency_rules']
+
+    strategy.business_name = 'Acme Labs'
+    document = manager.generate_brand_guidelines_document(strategy, [])
+    assert document['brand_overview']['brand_name'] == 'Acme Labs'
@@ -0,0 +1,195 @@
+"""Gemini call handling in the strategy engine, exercised against a fake async client"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from google.genai import errors as genai_errors
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'backend'))
+
+from ai_engines import emergent_strategy  # noqa: E402
+from ai_engines.emergent_strategy import AdvancedBrandStrategyEngine  # noqa: E402
+
+
+class FakeModels:
+    """Stands in for client.aio.models, replying with a scripted sequence of texts or errors"""
+
+    def __init__(self, outcomes, release=None):
+        self.outcomes = list(outcomes)
+        self.release = release
+        self.calls = 0
+
+    async def generate_content_stream(self, model, contents, config=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        release = self.release
+
+        async def stream():
+            if release is not None:
+                await release.wait()
+            yield SimpleNamespace(text=outcome)
+
+        return stream()
+
+
+def rate_limit_error(retry_delay):
+    return genai_errors.ClientError(429, {'error': {
+        'code': 429, 'status': 'RESOURCE_EXHAUSTED', 'details': [{'retryDelay': retry_delay}]
+    }})
+
+
+def server_error():
+    return genai_errors.ServerError(503, {'error': {'code': 503, 'status': 'UNAVAILABLE'}})
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_state(monkeypatch):
+    # Breaker and prompt cache state live on the class; restore them after each test
+    monkeypatch.setattr(AdvancedBrandStrategyEngine, '_consecutive_failures', 0)
+    monkeypatch.setattr(AdvancedBrandStrategyEngine, '_circuit_open_until', 0.0)
+    monkeypatch.setattr(AdvancedBrandStrategyEngine, '_prompt_caches', {})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(emergent_strategy.asyncio, 'sleep', fake_sleep)
+    return delays
+
+
+def make_engine(monkeypatch, models):
+    client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    monkeypatch.setattr(AdvancedBrandStrategyEngine, 'client', property(lambda self: client))
+    return AdvancedBrandStrategyEngine()
+
+
+def test_retry_waits_for_server_requested_delay(monkeypatch, sleeps):
+    models = FakeModels([rate_limit_error('12s'), '{"ok": true}'])
+    engine = make_engine(monkeypatch, models)
+
+    assert asyncio.run(engine._call_gemini('prompt', 100)) == '{"ok": true}'
+    assert models.calls == 2
+    assert sleeps == [12.0]
+    assert AdvancedBrandStrategyEngine._consecutive_failures == 0
+
+
+def test_retry_uses_jittered_backoff_without_server_delay(monkeypatch, sleeps):
+    models = FakeModels([server_error(), server_error(), '{}'])
+    engine = make_engine(monkeypatch, models)
+
+    asyncio.run(engine._call_gemini('prompt', 100))
+    assert len(sleeps) == 2
+    assert 1.0 <= sleeps[0] <= 1.5
+    assert 2.0 <= sleeps[1] <= 2.5
+
+
+def test_non_transient_error_is_not_retried(monkeypatch, sleeps):
+    models = FakeModels([genai_errors.ClientError(400, {'error': {'code': 400}})])
+    engine = make_engine(monkeypatch, models)
+
+    with pytest.raises(genai_errors.ClientError):
+        asyncio.run(engine._call_gemini('prompt', 100))
+    assert models.calls == 1
+    assert sleeps == []
+
+
+def test_circuit_breaker_opens_and_resets(monkeypatch, sleeps):
+    monkeypatch.setattr(emergent_strategy, 'CIRCUIT_BREAKER_FAILURE_THRESHOLD', 3)
+    models = FakeModels([server_error()])
+    engine = make_engine(monkeypatch, models)
+
+    with pytest.raises(genai_errors.ServerError):
+        asyncio.run(engine._call_gemini('prompt', 100))
+    assert models.calls == 3
+    assert AdvancedBrandStrategyEngine._circuit_open_until > time.monotonic()
+
+    # While open, calls fail fast without reaching Gemini
+    with pytest.raises(RuntimeError, match='circuit breaker is open'):
+        asyncio.run(engine._call_gemini('prompt', 100))
+    assert models.calls == 3
+
+    # Once the reset window has passed, a successful call closes the breaker again
+    AdvancedBrandStrategyEngine._circuit_open_until = time.monotonic() - 1
+    models.outcomes = ['{}']
+    assert asyncio.run(engine._call_gemini('prompt', 100)) == '{}'
+    assert AdvancedBrandStrategyEngine._consecutive_failures == 0
+
+
+def test_inflight_request_survives_cancelled_caller(monkeypatch):
+    async def scenario():
+        models = FakeModels(['{"name": "Acme"}'], release=asyncio.Event())
+        engine = make_engine(monkeypatch, models)
+
+        first = asyncio.ensure_future(engine._generate_json('prompt'))
+        second = asyncio.ensure_future(engine._generate_json('prompt'))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        models.release.set()
+        result = await second
+
+        assert first.cancelled()
+        assert result == {'name': 'Acme'}
+        assert models.calls == 1
+        assert engine._inflight_requests == {}
+        assert orjson.loads(engine._response_cache[engine._response_cache_key('prompt', emergent_strategy.PHASE2_STRATEGY_OUTPUT_TOKENS)]) == result
+
+        # The cached reply is served without another Gemini call
+        assert await engine._generate_json('prompt') == result
+        assert models.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_response_cache_key_normalizes_whitespace_but_keeps_case():
+    engine = AdvancedBrandStrategyEngine()
+
+    key = engine._response_cache_key('Brand  for\n ACME ', 100)
+    assert engine._response_cache_key('Brand for ACME', 100) == key
+    assert engine._response_cache_key('Brand for Acme', 100) != key
+    assert engine._response_cache_key('Brand for ACME', 200) != key
+
+
+def test_response_cache_key_includes_response_schema():
+    engine = AdvancedBrandStrategyEngine()
+    market_schema = emergent_strategy.ANALYSIS_LAYERS['market_intelligence'].schema
+    visual_schema = emergent_strategy.ANALYSIS_LAYERS['visual_direction'].schema
+
+    key = engine._response_cache_key('prompt', 100, market_schema)
+    assert engine._response_cache_key('prompt', 100, market_schema) == key
+    assert engine._response_cache_key('prompt', 100, visual_schema) != key
+    assert engine._response_cache_key('prompt', 100) != key
+
+
+def test_single_shot_non_object_reply_falls_back_to_layers(monkeypatch):
+    engine = make_engine(monkeypatch, FakeModels(['["not", "an", "object"]']))
+    business_input = emergent_strategy.BusinessInput(
+        business_name='Acme', business_description='d', industry='i', target_audience='t', business_values=['x']
+    )
+
+    assert asyncio.run(engine._analyze_business_concept_single_shot(business_input)) == {}
+
+
+def test_prompts_differing_in_case_get_separate_replies(monkeypatch):
+    models = FakeModels(['{"name": "Acme Corp"}', '{"name": "acme corp"}'])
+    engine = make_engine(monkeypatch, models)
+
+    async def scenario():
+        first = await engine._generate_json('Strategy for Acme Corp')
+        second = await engine._generate_json('Strategy  for acme corp')
+        return first, second
+
+    assert asyncio.run(scenario()) == ({'name': 'Acme Corp'}, {'name': 'acme corp'})
+    assert models.calls == 2